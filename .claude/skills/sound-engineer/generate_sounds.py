@@ -9,15 +9,243 @@ Generates programmatic audio for game sound effects:
 - UI sounds (player join chime, button click)
 """
 
+import io
+import math
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from scipy.io import wavfile
+from scipy.signal import resample_poly
 import os
 import subprocess
 import sys
 
+try:
+    from numba import njit, prange, set_num_threads
+except ImportError:  # Numba is optional: kernels then run as plain Python loops
+    prange = range
+    set_num_threads = None
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 SAMPLE_RATE = 44100
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '../../static/audio/sfx')
 
+TWO_PI = np.float32(2 * np.pi)
+
+# The engine tones are synthesised at SAMPLE_RATE / ENGINE_DECIMATION and
+# upsampled once. Their highest partial stays under ~4.3 kHz even at the peak of
+# the rev wobble, comfortably inside the 5.5 kHz Nyquist of the reduced rate.
+ENGINE_DECIMATION = 4
+
+# Shared read-only time bases, keyed by (duration, SAMPLE_RATE). Several sounds
+# use the same duration, so each linspace is only built once per run.
+_TIME_CACHE = {}
+
+# Per-process bump arena for short-lived float32 intermediates (noise inputs,
+# envelopes, phase ramps). Each generator resets it on entry, so those buffers
+# are carved out of one preallocated block instead of fresh allocations.
+# Returned sounds never come from it: they must outlive the next reset.
+ARENA_SAMPLES = SAMPLE_RATE * 3 * 2
+_ARENA = np.empty(ARENA_SAMPLES, dtype=np.float32)
+_arena_cursor = [0]
+
+# PCG64 generator for noise, seeded per process from OS entropy so spawned
+# pool workers never share a stream.
+_rng = np.random.default_rng()
+
+_sin = np.sin
+_exp = np.exp
+
+
+def _reset_scratch():
+    """Release every scratch buffer handed out since the last reset"""
+    _arena_cursor[0] = 0
+
+
+def _scratch(n):
+    """Return an uninitialised float32 view of ``n`` samples from the arena"""
+    start = _arena_cursor[0]
+    end = start + n
+    if end > ARENA_SAMPLES:
+        raise MemoryError(f"scratch arena exhausted ({end} > {ARENA_SAMPLES} samples)")
+    _arena_cursor[0] = end
+    return _ARENA[start:end]
+
+
+def _time(duration):
+    """Return a cached, read-only float32 time array for ``duration`` seconds"""
+    key = (duration, SAMPLE_RATE)
+    t = _TIME_CACHE.get(key)
+    if t is None:
+        t = np.linspace(0, duration, int(SAMPLE_RATE * duration), dtype=np.float32)
+        t.setflags(write=False)
+        _TIME_CACHE[key] = t
+    return t
+
+
+def _sine(t, freq, out=None):
+    """sin(2*pi*freq*t) computed in place (into ``out`` when given)"""
+    out = np.multiply(t, TWO_PI * np.float32(freq), out=out)
+    return _sin(out, out=out)
+
+
+def _decay(t, rate, out=None):
+    """Exponential decay envelope exp(-rate*t) computed in place"""
+    out = np.multiply(t, np.float32(-rate), out=out)
+    return _exp(out, out=out)
+
+
+def _noise(n):
+    """Uniform white noise in [-1, 1) as a float32 scratch buffer"""
+    out = _scratch(n)
+    _rng.random(dtype=np.float32, out=out)
+    out *= np.float32(2)
+    out -= np.float32(1)
+    return out
+
+
+def _loop_crossfade(sound, fade_seconds):
+    """Crossfade the tail into the head and trim it for a seamless loop"""
+    fade_samples = int(SAMPLE_RATE * fade_seconds)
+    fade_in = np.linspace(0, 1, fade_samples, dtype=np.float32)
+    fade_out = np.linspace(1, 0, fade_samples, dtype=np.float32)
+
+    sound[:fade_samples] = sound[:fade_samples] * fade_in + sound[-fade_samples:] * fade_out
+    return sound[:-fade_samples]  # Trim end for perfect loop
+
+
+def box_filter(x, n):
+    """Moving average of width ``n``, same result as
+    ``np.convolve(x, np.ones(n) / n, mode='same')``
+
+    Uses a prefix sum so each output sample costs two adds regardless of ``n``
+    instead of ``n`` multiply-adds. The sum runs in float64 so long buffers do
+    not drift; the result comes back as float32.
+    """
+    padded = np.concatenate((
+        np.zeros(n // 2, dtype=np.float64),
+        x,
+        np.zeros((n - 1) // 2, dtype=np.float64),
+    ))
+    c = np.empty(len(padded) + 1, dtype=np.float64)
+    c[0] = 0.0
+    np.cumsum(padded, out=c[1:])
+    y = c[n:] - c[:-n]
+    y /= n
+    return y.astype(np.float32)
+
+
+def _engine_tone(t, base_freq, coeffs, wobble_amps, wobble_freqs):
+    """engine_kernel evaluated on every ENGINE_DECIMATION-th sample of ``t``
+    and polyphase-upsampled back to ``len(t)`` samples at SAMPLE_RATE
+    """
+    t_lo = _scratch((len(t) + ENGINE_DECIMATION - 1) // ENGINE_DECIMATION)
+    t_lo[:] = t[::ENGINE_DECIMATION]
+    tone_lo = engine_kernel(t_lo, base_freq, coeffs, wobble_amps, wobble_freqs)
+    tone = resample_poly(tone_lo, ENGINE_DECIMATION, 1, padtype='line')
+    return tone[:len(t)].astype(np.float32, copy=False)
+
+
+# --- Fused DSP kernels --------------------------------------------------------
+# Each kernel makes one pass over the sample buffer instead of one NumPy pass
+# per harmonic/envelope term. They are compiled with Numba when it is installed
+# and otherwise run as plain Python (correct, just slower).
+
+@njit(parallel=True, fastmath=True, cache=True)
+def engine_kernel(t, base_freq, coeffs, wobble_amps, wobble_freqs):
+    """Wobbled harmonic stack, one sweep over ``t``
+
+    out[i] = sum_k coeffs[k] * sin(2*pi*(k+1)*base_freq*w(t)*t)
+    where w(t) = 1 + sum_j wobble_amps[j] * sin(2*pi*wobble_freqs[j]*t).
+    """
+    n = t.shape[0]
+    out = np.empty_like(t)
+    two_pi = 2.0 * math.pi
+    for i in prange(n):
+        ti = t[i]
+        wobble = 1.0
+        for j in range(wobble_amps.shape[0]):
+            wobble += wobble_amps[j] * math.sin(two_pi * wobble_freqs[j] * ti)
+        phase = two_pi * base_freq * wobble * ti
+        acc = 0.0
+        for k in range(coeffs.shape[0]):
+            acc += coeffs[k] * math.sin((k + 1) * phase)
+        out[i] = acc
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def collision_kernel(t, noise, freqs, amps, decays, noise_amp, noise_decay):
+    """Sum of exponentially decaying partials plus a decaying noise burst
+
+    out[i] = sum_k amps[k] * sin(2*pi*freqs[k]*t) * exp(-decays[k]*t)
+             + noise_amp * noise[i] * exp(-noise_decay*t)
+    """
+    n = t.shape[0]
+    out = np.empty_like(t)
+    two_pi = 2.0 * math.pi
+    for i in prange(n):
+        ti = t[i]
+        acc = noise_amp * noise[i] * math.exp(-noise_decay * ti)
+        for k in range(freqs.shape[0]):
+            acc += amps[k] * math.sin(two_pi * freqs[k] * ti) * math.exp(-decays[k] * ti)
+        out[i] = acc
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def screech_kernel(t, noise, base_pitch, pitch_depth, mod_amps, mod_freqs,
+                   screech_amp, carrier_amp):
+    """Band-passed noise plus a pitch-modulated FM carrier in a single pass
+
+    Fuses ``np.diff`` + 3-tap moving average over ``noise`` with the
+    ``sin(2*pi*cumsum(pitch/SAMPLE_RATE))`` carrier. The phase accumulator is a
+    running sum, so this loop is sequential rather than ``prange``.
+    """
+    n = t.shape[0]
+    out = np.empty_like(t)
+    two_pi = 2.0 * math.pi
+    inv_sr = 1.0 / SAMPLE_RATE
+    cycles = 0.0
+    for i in range(n):
+        # diff(noise, prepend=noise[0]) smoothed by a centred 3-tap average;
+        # the three differences telescope to noise[i+1] - noise[i-2].
+        hi = noise[i + 1] if i + 1 < n else noise[i]
+        lo = noise[i - 2] if i >= 2 else noise[0]
+        screech = (hi - lo) / 3.0
+
+        mod = 0.0
+        for j in range(mod_amps.shape[0]):
+            mod += mod_amps[j] * math.sin(two_pi * mod_freqs[j] * t[i])
+        cycles += (base_pitch + pitch_depth * mod) * inv_sr
+        out[i] = screech_amp * screech + carrier_amp * math.sin(two_pi * cycles)
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def fm_sin(pitch, sr, octave_amp=0.0):
+    """FM carrier for an instantaneous-frequency track, in one pass
+
+    out[i] = sin(phi[i]) + octave_amp * sin(2*phi[i]), where phi is the running
+    sum of 2*pi*pitch/sr. The fundamental and octave phases advance together in
+    float64, replacing a cumsum pass, a scale pass and one sin pass per partial.
+    """
+    n = pitch.shape[0]
+    out = np.empty_like(pitch)
+    k = 2.0 * math.pi / sr
+    phi = 0.0
+    phi2 = 0.0
+    for i in range(n):
+        dphi = pitch[i] * k
+        phi += dphi
+        phi2 += 2.0 * dphi
+        out[i] = math.sin(phi) + octave_amp * math.sin(phi2)
+    return out
+
 
 def ensure_output_dir():
     """Create output directory if it doesn't exist"""
@@ -25,247 +253,273 @@ def ensure_output_dir():
 
 
 def save_sound(samples, filename, use_mp3=True):
-    """Save samples to audio file"""
-    # Normalize to prevent clipping
-    max_val = np.max(np.abs(samples))
-    if max_val > 0:
-        samples = samples / max_val * 0.9
+    """Save samples to audio file
+
+    ``samples`` is consumed: normalisation and rounding happen in place so the
+    only new buffer is the int16 PCM output.
+    """
+    samples = np.asarray(samples, dtype=np.float32)
+
+    # Normalize to prevent clipping (peak from min/max avoids an np.abs copy),
+    # folding the 16-bit full-scale factor into the same multiply
+    max_val = max(float(samples.max()), -float(samples.min()))
+    scale = 32767 * 0.9 / max_val if max_val > 0 else 32767
+    np.multiply(samples, np.float32(scale), out=samples)
+    np.rint(samples, out=samples)
 
     # Convert to 16-bit
-    samples_16bit = (samples * 32767).astype(np.int16)
+    samples_16bit = samples.astype(np.int16)
 
     filepath = os.path.join(OUTPUT_DIR, filename)
     wav_path = filepath.replace('.mp3', '.wav')
 
-    # Save as WAV
-    wavfile.write(wav_path, SAMPLE_RATE, samples_16bit)
-    print(f"  Saved: {wav_path}")
+    # Build the WAV in memory; ffmpeg reads it from stdin, so the WAV only
+    # reaches disk when it is the final output
+    wav = io.BytesIO()
+    wavfile.write(wav, SAMPLE_RATE, samples_16bit)
+    wav_bytes = wav.getvalue()
 
     # Convert to MP3 if requested
     if use_mp3 and filename.endswith('.mp3'):
         try:
             subprocess.run([
-                'ffmpeg', '-y', '-i', wav_path,
+                'ffmpeg', '-y', '-f', 'wav', '-i', 'pipe:0',
                 '-codec:a', 'libmp3lame', '-b:a', '128k',
                 filepath
-            ], capture_output=True, check=True)
-            os.remove(wav_path)
+            ], input=wav_bytes, capture_output=True, check=True)
             print(f"  Converted to: {filepath}")
+            return
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             print(f"  Warning: Could not convert to MP3 (ffmpeg not available?)")
             print(f"  Keeping WAV file: {wav_path}")
 
+    with open(wav_path, 'wb') as f:
+        f.write(wav_bytes)
+    print(f"  Saved: {wav_path}")
+
 
 def generate_engine_idle():
     """Generate low rumbling idle engine sound (loopable)"""
     print("Generating engine_idle...")
+    _reset_scratch()
     duration = 2.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _time(duration)
 
     base_freq = 65  # Low rumble
 
-    # Slight random wobble for realism
-    wobble = 1 + 0.015 * np.sin(2 * np.pi * 3.5 * t)
-    wobble += 0.01 * np.sin(2 * np.pi * 7 * t)
-
-    # Multiple harmonics
-    sound = 0.5 * np.sin(2 * np.pi * base_freq * wobble * t)
-    sound += 0.25 * np.sin(2 * np.pi * base_freq * 2 * wobble * t)
-    sound += 0.12 * np.sin(2 * np.pi * base_freq * 3 * wobble * t)
-    sound += 0.06 * np.sin(2 * np.pi * base_freq * 4 * wobble * t)
-
     # Add filtered noise for texture
-    noise = np.random.uniform(-1, 1, len(t))
+    noise = _noise(len(t))
     # Simple low-pass by averaging
-    noise_filtered = np.convolve(noise, np.ones(100)/100, mode='same')
-    sound += noise_filtered * 0.08
+    noise_filtered = box_filter(noise, 100)
 
-    # Crossfade for seamless loop
-    fade_samples = int(SAMPLE_RATE * 0.1)
-    fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
+    # Slight wobble for realism, multiple harmonics in one pass
+    sound = _engine_tone(
+        t, base_freq,
+        np.array([0.5, 0.25, 0.12, 0.06]),
+        np.array([0.015, 0.01]), np.array([3.5, 7.0]),
+    )
+    noise_filtered *= np.float32(0.08)
+    sound += noise_filtered
 
-    sound[:fade_samples] = sound[:fade_samples] * fade_in + sound[-fade_samples:] * fade_out
-    sound = sound[:-fade_samples]  # Trim end for perfect loop
+    # Crossfade for seamless loop
+    sound = _loop_crossfade(sound, 0.1)
 
-    save_sound(sound, 'engine_idle.mp3')
+    return sound, 'engine_idle.mp3'
 
 
 def generate_engine_rev():
     """Generate higher-pitched engine rev sound (loopable)"""
     print("Generating engine_rev...")
+    _reset_scratch()
     duration = 2.0
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _time(duration)
 
     base_freq = 120  # Higher for revving
 
-    # More aggressive wobble
-    wobble = 1 + 0.03 * np.sin(2 * np.pi * 8 * t)
-    wobble += 0.02 * np.sin(2 * np.pi * 12 * t)
-
-    # Richer harmonics
-    sound = 0.4 * np.sin(2 * np.pi * base_freq * wobble * t)
-    sound += 0.3 * np.sin(2 * np.pi * base_freq * 2 * wobble * t)
-    sound += 0.2 * np.sin(2 * np.pi * base_freq * 3 * wobble * t)
-    sound += 0.1 * np.sin(2 * np.pi * base_freq * 4 * wobble * t)
-    sound += 0.05 * np.sin(2 * np.pi * base_freq * 5 * wobble * t)
-
     # More noise for aggressive character
-    noise = np.random.uniform(-1, 1, len(t))
-    noise_filtered = np.convolve(noise, np.ones(50)/50, mode='same')
-    sound += noise_filtered * 0.12
+    noise = _noise(len(t))
+    noise_filtered = box_filter(noise, 50)
+
+    # More aggressive wobble, richer harmonics
+    sound = _engine_tone(
+        t, base_freq,
+        np.array([0.4, 0.3, 0.2, 0.1, 0.05]),
+        np.array([0.03, 0.02]), np.array([8.0, 12.0]),
+    )
+    noise_filtered *= np.float32(0.12)
+    sound += noise_filtered
 
     # Crossfade for loop
-    fade_samples = int(SAMPLE_RATE * 0.08)
-    fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
-    sound[:fade_samples] = sound[:fade_samples] * fade_in + sound[-fade_samples:] * fade_out
-    sound = sound[:-fade_samples]
+    sound = _loop_crossfade(sound, 0.08)
 
-    save_sound(sound, 'engine_rev.mp3')
+    return sound, 'engine_rev.mp3'
 
 
 def generate_collision_soft():
     """Generate soft collision/bump sound"""
     print("Generating collision_soft...")
+    _reset_scratch()
     duration = 0.25
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-
-    # Quick decay envelope
-    envelope = np.exp(-t * 25)
+    t = _time(duration)
 
-    # Low thump
-    thump = np.sin(2 * np.pi * 80 * t) * envelope
-
-    # Noise burst
-    noise = np.random.uniform(-1, 1, len(t)) * envelope * 0.3
-
-    sound = thump * 0.7 + noise * 0.3
-    save_sound(sound, 'collision_soft.mp3')
+    # Low thump and a noise burst sharing one quick decay envelope
+    sound = collision_kernel(
+        t, _noise(len(t)),
+        np.array([80.0]), np.array([0.7]), np.array([25.0]),
+        0.3 * 0.3, 25.0,
+    )
+    return sound, 'collision_soft.mp3'
 
 
 def generate_collision_hard():
     """Generate hard collision/crash sound"""
     print("Generating collision_hard...")
+    _reset_scratch()
     duration = 0.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-
-    # Slower decay for more impact
-    envelope = np.exp(-t * 12)
+    t = _time(duration)
 
-    # Deep thump
-    thump = np.sin(2 * np.pi * 60 * t) * envelope
-
-    # Add mid-range impact
-    mid = np.sin(2 * np.pi * 200 * t) * envelope * 0.3
-
-    # Metallic ring
-    ring = np.sin(2 * np.pi * 1200 * t) * np.exp(-t * 30) * 0.15
-
-    # More noise
-    noise = np.random.uniform(-1, 1, len(t)) * envelope * 0.4
-
-    sound = thump * 0.5 + mid + ring + noise * 0.3
-    save_sound(sound, 'collision_hard.mp3')
+    # Deep thump and mid-range impact on a slower decay, plus a metallic ring
+    # that dies away faster, over more noise
+    sound = collision_kernel(
+        t, _noise(len(t)),
+        np.array([60.0, 200.0, 1200.0]),
+        np.array([0.5, 0.3, 0.15]),
+        np.array([12.0, 12.0, 30.0]),
+        0.4 * 0.3, 12.0,
+    )
+    return sound, 'collision_hard.mp3'
 
 
 def generate_tire_screech():
     """Generate tire screech/skid sound (loopable)"""
     print("Generating tire_screech...")
+    _reset_scratch()
     duration = 1.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
-
-    # High-frequency noise base
-    noise = np.random.uniform(-1, 1, len(t))
-
-    # Band-pass effect: differentiate then integrate slightly
-    screech = np.diff(noise, prepend=noise[0])
-    screech = np.convolve(screech, np.ones(3)/3, mode='same')
-
-    # Pitch modulation for realism
-    mod = np.sin(2 * np.pi * 12 * t) * 0.3 + np.sin(2 * np.pi * 5 * t) * 0.2
-    pitch = 3000 + 800 * mod
-    carrier = np.sin(2 * np.pi * np.cumsum(pitch / SAMPLE_RATE))
+    t = _time(duration)
 
-    sound = screech * 0.4 + carrier * 0.15
+    # High-frequency noise base, band-passed (differentiate then integrate
+    # slightly) and mixed with a pitch-modulated carrier for realism
+    sound = screech_kernel(
+        t, _noise(len(t)),
+        3000.0, 800.0,
+        np.array([0.3, 0.2]), np.array([12.0, 5.0]),
+        0.4, 0.15,
+    )
 
     # Fade ends for loop
     fade = int(0.1 * SAMPLE_RATE)
-    envelope = np.ones(len(t))
-    envelope[:fade] *= np.linspace(0, 1, fade)
-    envelope[-fade:] *= np.linspace(1, 0, fade)
+    sound[:fade] *= np.linspace(0, 1, fade, dtype=np.float32)
+    sound[-fade:] *= np.linspace(1, 0, fade, dtype=np.float32)
 
-    sound = sound * envelope * 0.6
-    save_sound(sound, 'tire_screech.mp3')
+    sound *= np.float32(0.6)
+    return sound, 'tire_screech.mp3'
 
 
 def generate_player_join():
     """Generate pleasant chime for player join notification"""
     print("Generating player_join...")
+    _reset_scratch()
     duration = 0.5
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _time(duration)
 
     # Two-note ascending chime (C5 -> E5)
     freq1, freq2 = 523, 659
 
     half = len(t) // 2
     note1_t = t[:half]
-    note2_t = t[half:]
+    note2_t = t[half:] - t[half]  # Second note restarts its own clock
 
-    note1 = np.sin(2 * np.pi * freq1 * note1_t) * np.exp(-note1_t * 4)
-    note2 = np.sin(2 * np.pi * freq2 * (note2_t - note2_t[0])) * np.exp(-(note2_t - note2_t[0]) * 4)
+    sound = np.empty_like(t)
+    note1 = _sine(note1_t, freq1, out=sound[:half])
+    note1 *= _decay(note1_t, 4, out=_scratch(half))
+    note2 = _sine(note2_t, freq2, out=sound[half:])
+    note2 *= _decay(note2_t, 4, out=note2_t)
 
-    sound = np.concatenate([note1, note2]) * 0.5
-    save_sound(sound, 'player_join.mp3')
+    sound *= np.float32(0.5)
+    return sound, 'player_join.mp3'
 
 
 def generate_button_click():
     """Generate short UI click sound"""
     print("Generating button_click...")
+    _reset_scratch()
     duration = 0.06
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _time(duration)
 
     # Quick pop with fast decay
     freq = 1200
-    sound = np.sin(2 * np.pi * freq * t) * np.exp(-t * 80) * 0.4
+    silence = _scratch(len(t))
+    silence.fill(0)
+    sound = collision_kernel(
+        t, silence,
+        np.array([float(freq)]), np.array([0.4]), np.array([80.0]),
+        0.0, 0.0,
+    )
 
     # Add a tiny click transient
-    click = np.zeros(len(t))
-    click[:int(0.002 * SAMPLE_RATE)] = 0.3
+    sound[:int(0.002 * SAMPLE_RATE)] += np.float32(0.3)
 
-    sound = sound + click
-    save_sound(sound, 'button_click.mp3')
+    return sound, 'button_click.mp3'
 
 
 def generate_countdown_beep():
     """Generate countdown beep (for 3-2-1)"""
     print("Generating countdown_beep...")
+    _reset_scratch()
     duration = 0.15
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _time(duration)
 
     freq = 880  # A5
-    sound = np.sin(2 * np.pi * freq * t) * np.exp(-t * 15) * 0.5
+    sound = _sine(t, freq)
+    sound *= _decay(t, 15, out=_scratch(len(t)))
+    sound *= np.float32(0.5)
 
-    save_sound(sound, 'countdown_beep.mp3')
+    return sound, 'countdown_beep.mp3'
 
 
 def generate_countdown_go():
     """Generate 'GO!' sound (higher pitch, longer)"""
     print("Generating countdown_go...")
+    _reset_scratch()
     duration = 0.4
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration))
+    t = _time(duration)
 
     # Rising pitch sweep
     freq_start, freq_end = 600, 1200
-    freq = freq_start + (freq_end - freq_start) * (t / duration)
+    freq = np.multiply(t, np.float32((freq_end - freq_start) / duration), out=_scratch(len(t)))
+    freq += np.float32(freq_start)
+
+    # Fundamental plus a quieter octave from one phase accumulator
+    sound = fm_sin(freq, SAMPLE_RATE, 0.3)
+
+    sound *= _decay(t, 4, out=_scratch(len(t)))
+    sound *= np.float32(0.6)
+
+    return sound, 'countdown_go.mp3'
+
+
+GENERATORS = (
+    generate_engine_idle,
+    generate_engine_rev,
+    generate_collision_soft,
+    generate_collision_hard,
+    generate_tire_screech,
+    generate_player_join,
+    generate_button_click,
+    generate_countdown_beep,
+    generate_countdown_go,
+)
+
 
-    sound = np.sin(2 * np.pi * np.cumsum(freq / SAMPLE_RATE))
-    sound += 0.3 * np.sin(2 * np.pi * np.cumsum(freq * 2 / SAMPLE_RATE))
+def _init_worker():
+    """Each pool worker synthesises a whole sound, so keep kernels single-threaded"""
+    if set_num_threads is not None:
+        set_num_threads(1)
 
-    envelope = np.exp(-t * 4) * 0.6
-    sound = sound * envelope
 
-    save_sound(sound, 'countdown_go.mp3')
+def _generate(generator):
+    """Run one generator in a pool worker and return (samples, filename)"""
+    return generator()
 
 
 def main():
@@ -276,16 +530,20 @@ def main():
     ensure_output_dir()
     print(f"\nOutput directory: {OUTPUT_DIR}\n")
 
-    # Generate all sounds
-    generate_engine_idle()
-    generate_engine_rev()
-    generate_collision_soft()
-    generate_collision_hard()
-    generate_tire_screech()
-    generate_player_join()
-    generate_button_click()
-    generate_countdown_beep()
-    generate_countdown_go()
+    # Generate all sounds. The generators are independent, so they run across
+    # worker processes; each finished sound is handed straight to an encoder
+    # thread so ffmpeg runs while the remaining sounds are still synthesising.
+    # 'spawn' avoids forking a process that may already hold Numba threads.
+    workers = os.cpu_count() or 1
+    ctx = mp.get_context('spawn')
+    with ctx.Pool(min(workers, len(GENERATORS)), initializer=_init_worker) as pool, \
+            ThreadPoolExecutor(max_workers=workers) as encoders:
+        saves = [
+            encoders.submit(save_sound, samples, filename)
+            for samples, filename in pool.imap_unordered(_generate, GENERATORS)
+        ]
+        for save in saves:
+            save.result()
 
     print("\n" + "=" * 50)
     print("All sounds generated successfully!")
@@ -1,22 +1,40 @@
-from flask import Flask, render_template, request, jsonify, send_file, send_from_directory, g, make_response
+if __name__ == '__main__':
+    # Running the server directly: patch the stdlib before anything below
+    # imports socket/threading, so blocking calls yield to the eventlet hub.
+    # Under gunicorn the eventlet worker applies the same patching itself.
+    import eventlet
+    eventlet.monkey_patch()
+
+from flask import Flask, render_template, request, jsonify, send_from_directory, g, make_response
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from functools import wraps
 import os
-import random
+import secrets
 import string
 import json
 import logging
+import math
 import socket
-import qrcode
+import segno
 import io
-from PIL import Image
 import platform
 import subprocess
 import re
 import hmac
 import hashlib
+import struct
 import time
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover - optional; fall back to platform tools
+    psutil = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional; stdlib json encodes packets
+    orjson = None
+
 # Shared session vocabulary (topology / ruleset / role). Dual-import so the
 # module resolves both when run directly (`python server/app.py`, where
 # server/ is on sys.path) and when imported as a package (`server.app`, as the
@@ -37,6 +55,7 @@ try:
         PHASE_HOST_LOST,
         PHASE_RESULTS,
         PHASE_WAITING,
+        ROOM_IDLE_SECONDS,
         ROOM_TTL_SECONDS,
         append_room_trace,
         begin_room_match,
@@ -76,6 +95,7 @@ except ImportError:  # pragma: no cover - import path shim
         PHASE_HOST_LOST,
         PHASE_RESULTS,
         PHASE_WAITING,
+        ROOM_IDLE_SECONDS,
         ROOM_TTL_SECONDS,
         append_room_trace,
         begin_room_match,
@@ -113,9 +133,14 @@ except ImportError:  # pragma: no cover - package import path shim
         MAX_TOTAL_PAYLOAD_BYTES,
     )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging. Room lifecycle is logged at INFO; per-input gameplay
+# events (weapon fire, resets) only at DEBUG. LOG_LEVEL=WARNING quiets both.
+_log_level_name = os.environ.get('LOG_LEVEL', 'INFO').upper()
+_log_level = getattr(logging, _log_level_name, None)
+logging.basicConfig(level=_log_level if isinstance(_log_level, int) else logging.INFO)
 logger = logging.getLogger(__name__)
+if not isinstance(_log_level, int):
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", _log_level_name)
 
 # Check if dist/ exists (production build from Vite)
 dist_path = os.path.join(os.path.dirname(__file__), '..', 'dist')
@@ -135,9 +160,58 @@ else:
                 template_folder='../frontend')
 
 app.config['SECRET_KEY'] = 'race_game_secret!'
+
+
+class _OrjsonPacketCodec:
+    """json-module stand-in for Socket.IO / Engine.IO packet encoding.
+
+    orjson encodes several times faster than the stdlib; non-string dict keys
+    are stringified the way json.dumps does. Formatting kwargs such as
+    ``separators`` are accepted and ignored since orjson output is already
+    compact."""
+
+    @staticmethod
+    def dumps(obj, **_kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    @staticmethod
+    def loads(data, **_kwargs):
+        return orjson.loads(data)
+
+
+# Engine.IO transports the server accepts. Clients start on long-polling and
+# upgrade (E2E runs pin polling via ?testMode=1), so both stay on by default; a
+# deployment whose clients all reach it over WebSocket can set
+# SOCKETIO_TRANSPORTS=websocket to refuse the XHR long-poll path outright.
+SOCKETIO_TRANSPORTS = [
+    t.strip() for t in os.environ.get('SOCKETIO_TRANSPORTS', 'polling,websocket').split(',') if t.strip()
+]
+
 # Configure SocketIO - keep defaults for stability during long-polling
 # Shorter intervals caused "transport error" disconnects
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode='eventlet',
+    transports=SOCKETIO_TRANSPORTS,
+    # Game traffic is a stream of small packets (26-byte motion frames,
+    # ~150-byte control updates) that deflate can't shrink; compressing them
+    # only costs CPU and latency on the hot path.
+    http_compression=False,
+    json=_OrjsonPacketCodec if orjson is not None else json,
+)
+
+
+def _without_websocket_deflate(wsgi_app):
+    """Drop the client's WebSocket extension offer so the eventlet upgrade
+    never negotiates permessage-deflate (it has no switch of its own)."""
+    def middleware(environ, start_response):
+        environ.pop('HTTP_SEC_WEBSOCKET_EXTENSIONS', None)
+        return wsgi_app(environ, start_response)
+    return middleware
+
+
+app.wsgi_app = _without_websocket_deflate(app.wsgi_app)
 
 # Serve Vite bundled assets in production mode
 if os.path.exists(dist_path):
@@ -154,6 +228,8 @@ if os.path.exists(dist_path):
         response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
         return response
 
+    _ASSET_REF_RE = re.compile(r'/assets/[A-Za-z0-9_.\-]+\.(?:js|css)')
+
     @app.route('/host-assets.json')
     def host_assets_manifest():
         """Critical-path host bundles, so the landing page can prefetch them
@@ -168,7 +244,7 @@ if os.path.exists(dist_path):
         host_html = os.path.join(dist_path, 'frontend', 'host', 'index.html')
         try:
             with open(host_html, 'r', encoding='utf-8') as f:
-                refs.update(re.findall(r'/assets/[A-Za-z0-9_.\-]+\.(?:js|css)', f.read()))
+                refs.update(_ASSET_REF_RE.findall(f.read()))
         except OSError:
             pass
         try:
@@ -339,9 +415,12 @@ def _telemetry_sensitive_values(data=None):
     return tuple(values)
 
 
+_ERROR_FINGERPRINT_RE = re.compile(r'[A-Za-z0-9_.:-]{6,96}')
+
+
 def _safe_error_fingerprint(value):
     text = str(value or '').strip()
-    if re.fullmatch(r'[A-Za-z0-9_.:-]{6,96}', text):
+    if _ERROR_FINGERPRINT_RE.fullmatch(text):
         return text[:96]
     return None
 
@@ -579,6 +658,12 @@ def _telemetry_teardown_request(exc):
 #     }
 #   }
 # }
+#
+# Concurrency: handlers and background tasks are eventlet greenthreads on one
+# OS thread (async_mode is pinned to eventlet), so a room update that does not
+# yield (no socket/file I/O or sleep mid-update) runs atomically and needs no
+# lock. Loops over game_rooms that delete from it, or may yield mid-loop, must
+# iterate over a snapshot.
 game_rooms = {}
 
 # Abuse controls (3xv.4): per-seat cooldowns for spammable actions. Keyed by
@@ -590,34 +675,66 @@ _reset_rate_limiter = RateLimiter(1.0)    # <= 1 car-reset/sec per seat
 _name_rate_limiter = RateLimiter(2.0)     # <= 1 name change / 2s per seat
 
 
+def _socket_connected(sid):
+    return socketio.server.manager.is_connected(sid, '/')
+
+
 def _reap_rooms_if_needed():
-    prior_rooms = {room_code: room for room_code, room in game_rooms.items()}
     removed = reap_rooms(
         game_rooms,
         host_loss_grace=HOST_LOSS_GRACE_SECONDS,
         room_ttl=ROOM_TTL_SECONDS,
+        room_idle=ROOM_IDLE_SECONDS,
+        is_connected=_socket_connected,
     )
-    for room_code in removed:
-        room = prior_rooms.get(room_code)
-        if room is not None:
-            _telemetry_event(
-                'server:room:closed',
-                'reap_rooms',
-                room=room,
-                source='Flask',
-                properties={
-                    'reason': 'ttl_expired',
-                    'playerCount': len(room.get('seats', {})),
-                    'duration_ms': int(max((time.time() - room.get('created_at', time.time())) * 1000, 0)),
-                },
-            )
-        logger.info(f"Room {room_code} reaped after TTL expiry")
+    for room_code, room in removed.items():
+        _QR_CACHE.pop(room_code, None)
+        reason = 'ttl_expired' if room.get('reap_at') is not None else 'idle_expired'
+        # Any client still parked in the room (e.g. a tab whose host vanished
+        # silently) is told it is gone before it is dropped.
+        socketio.emit('host_disconnected', _room_phase_payload(room_code, room), to=room_code)
+        _telemetry_event(
+            'server:room:closed',
+            'reap_rooms',
+            room=room,
+            source='Flask',
+            properties={
+                'reason': reason,
+                'playerCount': len(room.get('seats', {})),
+                'duration_ms': int(max((time.time() - room.get('created_at', time.time())) * 1000, 0)),
+            },
+        )
+        socketio.close_room(room_code)
+        socketio.close_room(_host_room(room_code))
+        logger.info(f"Room {room_code} reaped ({reason})")
+
+
+# Handlers reap lazily on entry; this task also sweeps while the server is
+# otherwise quiet so abandoned rooms do not linger until the next request.
+ROOM_REAP_INTERVAL_SECONDS = 60.0
+_room_reaper = None
+
+
+def _room_reaper_loop():
+    while True:
+        socketio.sleep(ROOM_REAP_INTERVAL_SECONDS)
+        try:
+            _reap_rooms_if_needed()
+        except Exception:
+            # This greenlet is started once; letting it die stops reaping for good
+            logger.exception("Room reaper pass failed")
+
+
+def _ensure_room_reaper():
+    global _room_reaper
+    if _room_reaper is None:
+        _room_reaper = socketio.start_background_task(_room_reaper_loop)
 
 
 def _generate_host_token():
     """Generate a signed host capability token."""
     timestamp = str(int(time.time()))
-    nonce = ''.join(random.choices(string.ascii_letters + string.digits, k=16))
+    nonce = secrets.token_urlsafe(12)
     message = f"{timestamp}:{nonce}".encode()
     secret = app.config['SECRET_KEY'].encode()
     signature = hmac.new(secret, message, hashlib.sha256).hexdigest()
@@ -700,8 +817,8 @@ def _new_room_state(room_code, host_sid, topology=DEFAULT_TOPOLOGY):
     )
 
 
-def _room_phase_payload(room_code):
-    room = game_rooms[room_code]
+def _room_phase_payload(room_code, room=None):
+    room = game_rooms[room_code] if room is None else room
     return _with_server_metadata({
         'room_code': room_code,
         'phase': room.get('phase', PHASE_WAITING),
@@ -732,8 +849,25 @@ def _seat_binding_sids(seat):
 
 
 def _emit_to_seat_bindings(event_name, payload, seat):
-    for sid in _seat_binding_sids(seat):
-        emit(event_name, payload, to=sid)
+    # One emit to the list of sids encodes the packet once for all of them.
+    # An empty list would broadcast, so it has to be skipped.
+    sids = _seat_binding_sids(seat)
+    if sids:
+        emit(event_name, payload, to=sids)
+
+
+def _host_room(room_code):
+    """Socket.IO room holding only the room's current host socket, so host
+    bound events are addressed by room code rather than a cached sid."""
+    return f'{room_code}:host'
+
+
+def _join_host_room(room_code):
+    # The host room only ever holds the current host socket. Empty it first so
+    # a replaced host, or a still-connected host of an earlier room that was
+    # reaped under the same code, stops receiving this room's host traffic.
+    socketio.close_room(_host_room(room_code))
+    join_room(_host_room(room_code))
 
 
 def _emit_zeroed_controls_to_host(room, seat):
@@ -742,19 +876,34 @@ def _emit_zeroed_controls_to_host(room, seat):
         return
 
     controls = seat.get('stats', {}).get('controls', {})
+    steering = float(controls.get('steering', 0) or 0)
+    acceleration = float(controls.get('acceleration', 0) or 0)
+    braking = float(controls.get('braking', 0) or 0)
+    seat['last_controls'] = (host_sid, seat['lease_version'], (steering, acceleration, braking))
     emit('player_controls_update', {
         'player_id': seat['player_id'],
         'seat_id': seat['seat_id'],
         'lease_version': seat['lease_version'],
-        'steering': float(controls.get('steering', 0) or 0),
-        'acceleration': float(controls.get('acceleration', 0) or 0),
-        'braking': float(controls.get('braking', 0) or 0),
+        'steering': steering,
+        'acceleration': acceleration,
+        'braking': braking,
         'timestamp': int(time.time() * 1000),
-    }, to=host_sid)
+    }, to=_host_room(room['room_code']))
 
 
-def _complete_join(room_code, room, join_result):
+# sid -> room codes it has joined, so disconnect and rename touch only those
+# rooms instead of scanning every live room. Entries are hints: each is re-checked
+# against the room's sid_index, and the whole set is dropped on disconnect.
+_sid_rooms = {}
+
+
+def _join_room_indexed(room_code):
     join_room(room_code)
+    _sid_rooms.setdefault(request.sid, set()).add(room_code)
+
+
+def _complete_join(room_code, room, join_result):
+    _join_room_indexed(room_code)
     emit('game_joined', _with_server_metadata(join_result['join_payload'], room))
     emit(
         join_result['lifecycle_event_name'],
@@ -890,17 +1039,85 @@ def get_join_url(room_code, local_ip=None, port=None):
     if local_ip is None:
         local_ip = get_local_ip()
     if port is None:
-        port = request.environ.get('SERVER_PORT', 8000)
-        if 'Host' in request.headers:
-            host_parts = request.headers['Host'].split(':')
-            if len(host_parts) > 1:
-                port = host_parts[1]
+        port = _request_port()
     return f"http://{local_ip}:{port}/player?room={room_code}"
 
 
+def _request_port():
+    """Port the client reached us on, parsed once per request context.
+
+    SERVER_PORT may not be accurate on all systems (or behind a proxy), so an
+    explicit port on X-Forwarded-Host / Host wins. Socket.IO handlers don't run
+    before_request hooks, hence the lazy memo on ``g`` instead.
+    """
+    port = g.get('port')
+    if port is None:
+        port = request.environ.get('SERVER_PORT', 5000)
+        host = request.headers.get('X-Forwarded-Host') or request.headers.get('Host')
+        if host:
+            _, sep, tail = host.rpartition(':')
+            if sep and ']' not in tail:  # '[::1]' has no port
+                port = tail
+        g.port = port
+    return port
+
+
+# LAN IP detection probes sockets and may shell out to the platform's network
+# tools, but the answer only changes when the network is reconfigured. Cache it
+# briefly so the host page and QR endpoints don't pay for it on every request.
+# Only the very first lookup runs inline; later refreshes happen in the
+# background while the previous answer keeps being served.
+LOCAL_IP_TTL_SECONDS = 60.0
+_IP_CACHE = {'ip': None, 'ts': 0.0, 'refreshing': False}
+
+# RFC 1918 blocks as inclusive 32-bit ranges, most preferred first: 192.168/16
+# (typical home network), then 10/8, then 172.16/12.
+_PRIVATE_RANGES = (
+    (0xC0A80000, 0xC0A8FFFF),
+    (0x0A000000, 0x0AFFFFFF),
+    (0xAC100000, 0xAC1FFFFF),
+)
+_IPV4 = struct.Struct('!I')
+
+
+def _ip_rank(ip):
+    """Index of the private range ``ip`` falls in (lower is preferred), or
+    len(_PRIVATE_RANGES) for any other or unparseable address."""
+    try:
+        value = _IPV4.unpack(socket.inet_aton(ip))[0]
+    except (OSError, TypeError):
+        return len(_PRIVATE_RANGES)
+    for rank, (low, high) in enumerate(_PRIVATE_RANGES):
+        if low <= value <= high:
+            return rank
+    return len(_PRIVATE_RANGES)
+
+
 def get_local_ip():
     """Get the local IP address of this machine for LAN connections.
-    Uses multiple methods to find the most likely local network IP.
+    Cached for LOCAL_IP_TTL_SECONDS; see _detect_local_ip for the lookup."""
+    ip = _IP_CACHE['ip']
+    if ip is None:
+        return _refresh_local_ip()
+
+    if time.monotonic() - _IP_CACHE['ts'] >= LOCAL_IP_TTL_SECONDS and not _IP_CACHE['refreshing']:
+        _IP_CACHE['refreshing'] = True
+        socketio.start_background_task(_refresh_local_ip)
+    return ip
+
+
+def _refresh_local_ip():
+    try:
+        ip = _detect_local_ip()
+        _IP_CACHE['ip'] = ip
+        _IP_CACHE['ts'] = time.monotonic()
+    finally:
+        _IP_CACHE['refreshing'] = False
+    return ip
+
+
+def _detect_local_ip():
+    """Find the most likely local network IP using multiple methods.
     Prioritizes addresses in the 192.168.x.x range which are most
     common for home networks."""
     private_ips = []
@@ -915,77 +1132,91 @@ def get_local_ip():
             private_ips.append(ip)
     except Exception as e:
         logger.error(f"Error getting IP via socket method: {e}")
+
+    # Method 2: Resolve our own hostname (no fork, usually answered from /etc/hosts)
+    try:
+        for info in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET):
+            ip = info[4][0]
+            if ip and not ip.startswith('127.') and ip not in private_ips:
+                private_ips.append(ip)
+    except Exception as e:
+        logger.error(f"Error getting IP via hostname lookup: {e}")
+
+    # Method 3: Enumerate the interfaces. Only needed when the cheap methods
+    # did not already turn up a preferred 192.168.x.x address, since that would
+    # win the ranking below anyway.
+    ranks = [_ip_rank(ip) for ip in private_ips]
+    if 0 not in ranks:
+        extra = _platform_local_ips()
+        private_ips.extend(extra)
+        ranks.extend(_ip_rank(ip) for ip in extra)
+
+    # If we have IPs, return the first one from the most preferred private
+    # range; with no private address at all, the first one found
+    if private_ips:
+        return private_ips[ranks.index(min(ranks))]
     
-    # Method 2: Try platform-specific commands
+    # Fallback to localhost if all methods fail
+    logger.warning("Could not determine local IP address, defaulting to localhost")
+    return '127.0.0.1'
+
+
+_IPV4_RE = re.compile(r'\d+\.\d+\.\d+\.\d+')
+
+
+def _platform_local_ips():
+    """Non-loopback IPv4 addresses of the local interfaces.
+
+    Read in-process through psutil when it is installed; otherwise parsed from
+    the platform's network tools."""
+    ips = []
+    if psutil is not None:
+        try:
+            for addrs in psutil.net_if_addrs().values():
+                for addr in addrs:
+                    if addr.family == socket.AF_INET and not addr.address.startswith('127.'):
+                        ips.append(addr.address)
+        except Exception as e:
+            logger.error(f"Error getting IP via psutil: {e}")
+        return ips
+
     system = platform.system()
     try:
         if system == 'Darwin':  # macOS
             cmd = "ifconfig | grep 'inet ' | grep -v '127.0.0.1' | awk '{print $2}'"
             output = subprocess.check_output(cmd, shell=True)
-            ips = output.decode().strip().split('\n')
-            for ip in ips:
-                if ip and not ip.startswith('127.'):
-                    private_ips.append(ip)
+            candidates = output.decode().strip().split('\n')
         elif system == 'Linux':
             cmd = "hostname -I"
             output = subprocess.check_output(cmd, shell=True)
-            ips = output.decode().strip().split()
-            for ip in ips:
-                if ip and not ip.startswith('127.'):
-                    private_ips.append(ip)
+            candidates = output.decode().strip().split()
         elif system == 'Windows':
             cmd = "ipconfig | findstr /i \"IPv4 Address\""
             output = subprocess.check_output(cmd, shell=True)
-            ips = re.findall(r'(\d+\.\d+\.\d+\.\d+)', output.decode())
-            for ip in ips:
-                if ip and not ip.startswith('127.'):
-                    private_ips.append(ip)
+            candidates = _IPV4_RE.findall(output.decode())
+        else:
+            candidates = []
+        for ip in candidates:
+            if ip and not ip.startswith('127.'):
+                ips.append(ip)
     except Exception as e:
         logger.error(f"Error getting IP via platform-specific method: {e}")
-    
-    # If we have IPs, rank them by preference
-    if private_ips:
-        # Prefer 192.168.x.x networks (most common for home networks)
-        for ip in private_ips:
-            if ip.startswith('192.168.'):
-                return ip
-        
-        # Next prefer 10.x.x.x networks
-        for ip in private_ips:
-            if ip.startswith('10.'):
-                return ip
-        
-        # Last try 172.16-31.x.x networks
-        for ip in private_ips:
-            if re.match(r'^172\.(1[6-9]|2[0-9]|3[0-1])\.', ip):
-                return ip
-        
-        # If none of the above patterns matched but we have IPs, return the first one
-        return private_ips[0]
-    
-    # Fallback to localhost if all methods fail
-    logger.warning("Could not determine local IP address, defaulting to localhost")
-    return '127.0.0.1'
+    return ips
 
 def generate_room_code(length=4):
-    """Generate a random room code of uppercase letters."""
-    return ''.join(random.choices(string.ascii_uppercase, k=length))
+    """Generate a random room code of uppercase letters.
+
+    One CSPRNG draw over the whole code space, spelled out in base 26."""
+    n = secrets.randbelow(26 ** length)
+    code = []
+    for _ in range(length):
+        n, digit = divmod(n, 26)
+        code.append(string.ascii_uppercase[digit])
+    return ''.join(code)
 
 def _get_host_info():
     """Get local IP and port for host templates."""
-    local_ip = get_local_ip()
-    port = request.environ.get('SERVER_PORT', 5000)
-    # For some reason, SERVER_PORT may not be accurate on all systems
-    # Check for host header to get actual port
-    if 'X-Forwarded-Host' in request.headers:
-        host_parts = request.headers['X-Forwarded-Host'].split(':')
-        if len(host_parts) > 1:
-            port = host_parts[1]
-    elif 'Host' in request.headers:
-        host_parts = request.headers['Host'].split(':')
-        if len(host_parts) > 1:
-            port = host_parts[1]
-    return local_ip, port
+    return get_local_ip(), _request_port()
 
 @app.route('/')
 def landing():
@@ -1034,43 +1265,62 @@ def weapon_lab():
     """
     return render_template('weapon-lab/index.html')
 
+# Rendered join-QR PNGs for live rooms: {room_code: (join_url, png_bytes)}.
+# A room's join URL is fixed, so reloads, reconnects and overlay re-renders
+# skip the QR encode + PNG compress. Entries go when the room is reaped, and
+# only codes of existing rooms are cached. The join URL's port comes from the
+# client's Host header, so each room keeps just its latest URL's PNG (a
+# mismatch replaces it) rather than one per Host value a client can invent.
+# Browsers may keep a live room's PNG for QR_MAX_AGE_SECONDS as well.
+_QR_CACHE = {}
+QR_MAX_AGE_SECONDS = 3600
+
+
+def _render_qr_png(join_url):
+    """Encode ``join_url`` as a QR code and return the PNG bytes."""
+    # Smallest version that fits at error level L (segno raises the level for
+    # free when the symbol has room), 10px modules with the standard 4-module
+    # quiet zone. make_qr never falls back to a Micro QR that phones can't read.
+    qr = segno.make_qr(join_url, error='L')
+
+    # Save to byte stream. segno already writes a 1-bit greyscale PNG; zlib
+    # level 1 instead of 9 nearly halves the encode (~3.2ms -> ~1.8ms) for
+    # ~400 extra bytes on a sub-1KB image that is cached per room anyway.
+    img_byte_arr = io.BytesIO()
+    qr.save(img_byte_arr, kind='png', scale=10, border=4, compresslevel=1)
+    return img_byte_arr.getvalue()
+
+
+def _png_response(png, max_age=None):
+    """Serve PNG bytes directly. send_file would wrap them in a BytesIO and a
+    file wrapper just to stream back bytes we already hold (~70us vs ~20us)."""
+    response = make_response(png)
+    response.mimetype = 'image/png'
+    if max_age is None:
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response
+
+
 @app.route('/qrcode/<room_code>')
 def generate_qr_code(room_code):
     """Generate a QR code for joining a specific room."""
     try:
-        local_ip = get_local_ip()
-        # Default port for Flask is 5000, but check headers for actual port
-        port = request.environ.get('SERVER_PORT', 5000)
-        if 'X-Forwarded-Host' in request.headers:
-            host_parts = request.headers['X-Forwarded-Host'].split(':')
-            if len(host_parts) > 1:
-                port = host_parts[1]
-        elif 'Host' in request.headers:
-            host_parts = request.headers['Host'].split(':')
-            if len(host_parts) > 1:
-                port = host_parts[1]
-            
         # Generate the URL with the room code
-        join_url = get_join_url(room_code, local_ip, port)
-        
-        # Create QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(join_url)
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Save to byte stream
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format='PNG')
-        img_byte_arr.seek(0)
-        
-        return send_file(img_byte_arr, mimetype='image/png')
+        join_url = get_join_url(room_code)
+
+        cached = _QR_CACHE.get(room_code)
+        if cached is not None and cached[0] == join_url:
+            png = cached[1]
+        else:
+            png = _render_qr_png(join_url)
+            if room_code not in game_rooms:
+                return _png_response(png)
+            _QR_CACHE[room_code] = (join_url, png)
+
+        return _png_response(png, max_age=QR_MAX_AGE_SECONDS)
     except Exception as e:
         logger.error(f"Error generating QR code: {e}")
         return jsonify({"error": str(e)}), 500
@@ -1095,18 +1345,14 @@ def create_room(data=None):
 
     room_state = _new_room_state(room_code, host_sid, topology)
     game_rooms[room_code] = room_state
+    _ensure_room_reaper()
     host_token = room_state['host_token']
 
-    join_room(room_code)
+    _join_room_indexed(room_code)
+    _join_host_room(room_code)
 
     # Get join URL with proper IP for display
-    local_ip = get_local_ip()
-    port = request.environ.get('SERVER_PORT', 8000)
-    if 'Host' in request.headers:
-        host_parts = request.headers['Host'].split(':')
-        if len(host_parts) > 1:
-            port = host_parts[1]
-    join_url = get_join_url(room_code, local_ip, port)
+    join_url = get_join_url(room_code)
 
     emit('room_created', _with_server_metadata({
         'room_code': room_code,
@@ -1178,11 +1424,13 @@ def reclaim_room(data):
         # be valid (but won't match stored token since room is new).
         prior_phase = None
         game_rooms[room_code] = _new_room_state(room_code, host_sid, data.get('topology'))
+        _ensure_room_reaper()
         new_token = game_rooms[room_code]['host_token']
         new_epoch = game_rooms[room_code]['host_epoch']
         logger.info(f"Host reclaimed missing room {room_code}")
 
-    join_room(room_code)
+    _join_room_indexed(room_code)
+    _join_host_room(room_code)
     emit('room_reclaimed', _with_server_metadata({
         'room_code': room_code,
         'topology': game_rooms[room_code]['topology'],
@@ -1245,6 +1493,24 @@ def return_to_lobby(data):
     logger.info(f"Room {room_code} returned to lobby")
 
 
+CONTROL_FORWARD_EPSILON = 0.01
+
+
+def _controls_unchanged(seat, host_sid, controls):
+    """True when `controls` are within CONTROL_FORWARD_EPSILON of what this
+    seat last forwarded to the same host under the same lease. The host keeps
+    the last controls it was sent, so a held stick needs no re-send; a new
+    host socket or lease always gets a fresh forward, as does a release back
+    to zero on any axis."""
+    last = seat.get('last_controls')
+    if last is None or last[0] != host_sid or last[1] != seat['lease_version']:
+        return False
+    for new, old in zip(controls, last[2]):
+        if new != old and (new == 0 or abs(new - old) >= CONTROL_FORWARD_EPSILON):
+            return False
+    return True
+
+
 @socketio.on('player_control_update')
 @_instrument_socket_handler('player_control_update')
 def player_control_update(data):
@@ -1315,6 +1581,11 @@ def player_control_update(data):
     acceleration = safe_controls['acceleration']
     braking = safe_controls['braking']
 
+    forwarded = (steering, acceleration, braking)
+    if _controls_unchanged(seat, host_sid, forwarded):
+        return
+    seat['last_controls'] = (host_sid, seat['lease_version'], forwarded)
+
     # Create validated control update
     control_update = {
         'player_id': seat['player_id'],
@@ -1329,7 +1600,7 @@ def player_control_update(data):
         control_update['seq'] = seq
 
     # Forward the control update to the host only
-    emit('player_controls_update', control_update, to=host_sid)
+    emit('player_controls_update', control_update, to=_host_room(room_code))
 
 
 @socketio.on('vehicle_states')
@@ -1639,7 +1910,7 @@ def kick_player(data):
             'player_name': seat.get('appearance', {}).get('name'),
             'can_reconnect': False,
             'kicked': True,
-        }, to=host_sid)
+        }, to=_host_room(room_code))
 
     logger.info(f"Player {seat.get('player_id')} kicked from room {room_code}")
 
@@ -1679,6 +1950,107 @@ def mode_selected(data):
     emit('mode_selected', _with_server_metadata({'mode': mode}, game_rooms[room_code]), to=room_code, include_self=False)
     logger.info(f"Mode selected in room {room_code}: {mode}")
 
+# Player motion goes to the host as packed little-endian binary frames rather
+# than JSON dicts: player_id, seat_id (uint32), then position, rotation and
+# velocity (3 x int16 fixed-point each) - 26 bytes per player. A players_update
+# message is a concatenation of such frames.
+_MOTION_IDS = struct.Struct('<II')
+_MOTION_VECTORS = struct.Struct('<9h')
+
+# Fixed-point scales (value = int16 / scale): 2 cm steps over +/-655 m, radians
+# spread over the full int16 range for +/-pi, and 1 cm/s steps over +/-327 m/s.
+# Out-of-range values saturate.
+MOTION_POSITION_SCALE = 50.0
+MOTION_ROTATION_SCALE = 32767 / math.pi
+MOTION_VELOCITY_SCALE = 100.0
+
+
+def _q16(value, scale):
+    return max(-32768, min(32767, round(value * scale)))
+
+
+def _pack_motion_vectors(position, rotation, velocity):
+    """Quantise and pack the three motion vectors; None if any is not 3 finite numbers."""
+    try:
+        # The 9-value struct alone would accept e.g. a 4+2+3 split
+        if len(position) != 3 or len(rotation) != 3 or len(velocity) != 3:
+            return None
+        return _MOTION_VECTORS.pack(
+            *(_q16(c, MOTION_POSITION_SCALE) for c in position),
+            *(_q16(c, MOTION_ROTATION_SCALE) for c in rotation),
+            *(_q16(c, MOTION_VELOCITY_SCALE) for c in velocity),
+        )
+    except (struct.error, TypeError, ValueError, OverflowError):
+        return None
+
+
+def _motion_frame(seat, vectors):
+    return _MOTION_IDS.pack(seat['player_id'], seat['seat_id']) + vectors
+
+
+# Motion batching: the newest frame from each player is held per host and a
+# background task flushes them PLAYER_MOTION_HZ times a second as a single
+# players_update message, so N controllers cost the host one event per tick.
+PLAYER_MOTION_HZ = 30
+_pending_motion = {}  # host_sid -> {player_sid: frame}
+_motion_flusher = None
+
+
+def _flush_pending_motion():
+    """Send every host the held frames of all its players as one message."""
+    if not _pending_motion:
+        return
+    batches = list(_pending_motion.items())
+    _pending_motion.clear()
+    for host_sid, frames in batches:
+        socketio.emit('players_update', b''.join(frames.values()), to=host_sid)
+
+
+def _motion_flush_loop():
+    while True:
+        socketio.sleep(1.0 / PLAYER_MOTION_HZ)
+        try:
+            _flush_pending_motion()
+        except Exception:
+            # Started once per process; if it died, no motion would reach hosts again
+            logger.exception("Motion flush tick failed")
+
+
+def _hold_motion(player_sid, host_sid, frame):
+    global _motion_flusher
+    _pending_motion.setdefault(host_sid, {})[player_sid] = frame
+    if _motion_flusher is None:
+        _motion_flusher = socketio.start_background_task(_motion_flush_loop)
+
+
+# A parked car still reports its pose every frame. Poses within these bounds of
+# the last one sent to the host are dropped, except for a heartbeat so the host
+# never goes more than MOTION_HEARTBEAT_SECONDS without hearing from a player.
+MOTION_EPSILON_POSITION = 0.01   # metres
+MOTION_EPSILON_ROTATION = 0.017  # radians, ~1 degree per axis
+MOTION_EPSILON_VELOCITY = 0.01   # m/s, i.e. effectively stopped
+MOTION_HEARTBEAT_SECONDS = 0.5
+
+
+def _motion_settled(seat, host_sid, position, rotation, velocity, now):
+    """True when this pose is within epsilon of the last one sent for the
+    seat to the same host and the car is at rest, inside the heartbeat.
+
+    Callers must have passed the vectors through _pack_motion_vectors first;
+    this indexes exactly three components of each."""
+    last = seat.get('last_motion')
+    if last is None or last[0] != host_sid or now - last[1] >= MOTION_HEARTBEAT_SECONDS:
+        return False
+    sent_position, sent_rotation = last[2], last[3]
+    dx, dy, dz = (position[i] - sent_position[i] for i in range(3))
+    if dx * dx + dy * dy + dz * dz >= MOTION_EPSILON_POSITION * MOTION_EPSILON_POSITION:
+        return False
+    if any(abs(rotation[i] - sent_rotation[i]) >= MOTION_EPSILON_ROTATION for i in range(3)):
+        return False
+    vx, vy, vz = velocity
+    return vx * vx + vy * vy + vz * vz < MOTION_EPSILON_VELOCITY * MOTION_EPSILON_VELOCITY
+
+
 @socketio.on('player_update')
 def player_update(data):
     """Player sends position and rotation updates."""
@@ -1695,17 +2067,23 @@ def player_update(data):
     if room_code not in game_rooms:
         return
 
+    # Malformed vectors can't be framed for the host; drop before touching seat state
+    vectors = _pack_motion_vectors(position, rotation, velocity)
+    if vectors is None:
+        return
+
     seat = update_seat_motion(game_rooms[room_code], player_sid, position, rotation, velocity)
     if not seat:
         return
 
-    emit('player_position_update', {
-        'player_id': seat['player_id'],
-        'seat_id': seat['seat_id'],
-        'position': position,
-        'rotation': rotation,
-        'velocity': velocity
-    }, to=game_rooms[room_code]['host_sid'])
+    host_sid = game_rooms[room_code]['host_sid']
+    if host_sid:
+        # Seat state above is always current; only the send is skipped.
+        now = time.monotonic()
+        if _motion_settled(seat, host_sid, position, rotation, velocity, now):
+            return
+        seat['last_motion'] = (host_sid, now, position, rotation)
+        _hold_motion(player_sid, host_sid, _motion_frame(seat, vectors))
 
 @socketio.on('disconnect')
 @_instrument_socket_handler('disconnect')
@@ -1713,9 +2091,13 @@ def handle_disconnect():
     """Handle client disconnection."""
     _reap_rooms_if_needed()
     client_sid = request.sid
+    # A departing host's batch has nowhere to go; a departing player's last
+    # frame is still delivered with the next tick.
+    _pending_motion.pop(client_sid, None)
 
-    for room_code, room_data in list(game_rooms.items()):
-        if client_sid not in room_data.get('sid_index', {}):
+    for room_code in _sid_rooms.pop(client_sid, ()):
+        room_data = game_rooms.get(room_code)
+        if room_data is None or client_sid not in room_data.get('sid_index', {}):
             continue
 
         disconnect_result = disconnect_binding(room_data, client_sid)
@@ -1758,12 +2140,14 @@ def handle_disconnect():
                 f"Seat {seat['seat_id']} controller disconnected during active phase in room {room_code}"
             )
         elif room_data.get('host_sid'):
+            # The host drops the car, so nothing it was sent still stands.
+            seat.pop('last_controls', None)
             emit('player_left', {
                 'player_id': seat['player_id'],
                 'seat_id': seat['seat_id'],
                 'player_name': seat['appearance']['name'],
                 'can_reconnect': True,
-            }, to=room_data['host_sid'])
+            }, to=_host_room(room_code))
         _telemetry_event(
             'server:player:left',
             'disconnect',
@@ -1814,20 +2198,20 @@ def handle_reset_position(data):
     seat['stats']['rotation'] = rotation
     seat['stats']['velocity'] = [0, 0, 0]
 
-    logger.info(f"Resetting position for player {player_id} in room {room_code} to {position}")
+    logger.debug("Resetting position for player %s in room %s to %s", player_id, room_code, position)
 
     _emit_to_seat_bindings('position_reset', {
         'position': position,
         'rotation': rotation
     }, seat)
 
-    emit('player_position_update', {
-        'player_id': player_id,
-        'seat_id': seat['seat_id'],
-        'position': position,
-        'rotation': rotation,
-        'velocity': [0, 0, 0]
-    }, to=game_rooms[room_code]['host_sid'])
+    # The reset pose goes out now, superseding any frame held from before it
+    host_sid = game_rooms[room_code]['host_sid']
+    vectors = _pack_motion_vectors(position, rotation, (0, 0, 0))
+    if vectors is not None:
+        _pending_motion.get(host_sid, {}).pop(seat.get('controller_sid'), None)
+        seat.pop('last_motion', None)
+        emit('players_update', _motion_frame(seat, vectors), to=_host_room(room_code))
             
 @socketio.on('weapon_fire')
 @_instrument_socket_handler('weapon_fire')
@@ -1858,9 +2242,9 @@ def handle_weapon_fire(data):
     emit('weapon_fire', {
         'player_id': seat['player_id'],
         'seat_id': seat['seat_id'],
-    }, to=room['host_sid'])
+    }, to=_host_room(room_code))
 
-    logger.debug(f"Player {seat['player_id']} fired weapon in room {room_code}")
+    logger.debug("Player %s fired weapon in room %s", seat['player_id'], room_code)
 
 @socketio.on('request_car_reset')
 @_instrument_socket_handler('request_car_reset')
@@ -1886,8 +2270,8 @@ def handle_request_car_reset(data):
     # car to a safe spot, so spamming it is an exploit).
     if not _reset_rate_limiter.allow(f"{room_code}:{seat['seat_id']}"):
         return
-    emit('car_reset_request', {'player_id': seat['player_id'], 'seat_id': seat['seat_id']}, to=room['host_sid'])
-    logger.info(f"Player {seat['player_id']} requested car reset in room {room_code}")
+    emit('car_reset_request', {'player_id': seat['player_id'], 'seat_id': seat['seat_id']}, to=_host_room(room_code))
+    logger.debug("Player %s requested car reset in room %s", seat['player_id'], room_code)
 
 @socketio.on('weapon_pickup')
 @_instrument_socket_handler('weapon_pickup')
@@ -1991,7 +2375,10 @@ def update_player_name(data):
     # clients render it as literal text (SafeTextRenderer), so markup never runs.
     new_name = canonicalize_name(raw_name)
 
-    for room_code, room_data in game_rooms.items():
+    for room_code in _sid_rooms.get(player_sid, ()):
+        room_data = game_rooms.get(room_code)
+        if room_data is None:
+            continue
         binding = lookup_binding_by_sid(room_data, player_sid)
         if not binding or not binding.get('seat') or binding['binding'].get('binding') != 'controller':
             continue
@@ -2014,7 +2401,7 @@ def update_player_name(data):
             'player_id': seat['player_id'],
             'seat_id': seat['seat_id'],
             'name': new_name
-        }, to=room_data['host_sid'])
+        }, to=_host_room(room_code))
 
         logger.info(
             f"Player name changed in room {room_code}: {seat['player_id']} -> {new_name}"
@@ -2149,7 +2536,12 @@ def reset_test_rooms():
         return jsonify({'error': 'not found'}), 404
 
     room_count = len(game_rooms)
+    for room_code in game_rooms:
+        socketio.close_room(room_code)
+        socketio.close_room(_host_room(room_code))
     game_rooms.clear()
+    _QR_CACHE.clear()
+    _sid_rooms.clear()
     server_telemetry.clear()
     logger.info(f"E2E reset cleared {room_count} rooms")
     return jsonify({'status': 'ok', 'rooms_cleared': room_count})
@@ -2157,6 +2549,6 @@ def reset_test_rooms():
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8000))
-    # Debug stays on for local development; deployments set FLASK_DEBUG=0
-    debug = os.environ.get('FLASK_DEBUG', '1') == '1'
+    # The Werkzeug reloader/debugger is opt-in (FLASK_DEBUG=1) for local work
+    debug = os.environ.get('FLASK_DEBUG') == '1'
     socketio.run(app, host='0.0.0.0', port=port, debug=debug)
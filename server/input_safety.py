@@ -37,6 +37,18 @@ _CONTROL_RANGES = {
     'acceleration': (0.0, 1.0),
     'braking': (0.0, 1.0),
 }
+_STEERING_MIN, _STEERING_MAX = _CONTROL_RANGES['steering']
+_ACCELERATION_MIN, _ACCELERATION_MAX = _CONTROL_RANGES['acceleration']
+_BRAKING_MIN, _BRAKING_MAX = _CONTROL_RANGES['braking']
+
+
+def _clamp(val, lo, hi):
+    """``max(lo, min(hi, val))`` without the two builtin calls."""
+    if val < lo:
+        return lo
+    if val > hi:
+        return hi
+    return val
 
 
 def validate_finite_controls(controls):
@@ -45,20 +57,26 @@ def validate_finite_controls(controls):
     Rejects the whole update if any axis is non-numeric or non-finite (NaN/Inf) —
     a poisoned axis must not reach physics. Missing axes default to 0. Finite
     values are clamped to their range.
+
+    Runs for every controller input, so the three axes are unrolled rather than
+    looped over ``_CONTROL_RANGES``.
     """
     if not isinstance(controls, dict):
         return None
-    out = {}
-    for key, (lo, hi) in _CONTROL_RANGES.items():
-        raw = controls.get(key, 0)
-        try:
-            val = float(raw)
-        except (TypeError, ValueError):
-            return None
-        if not math.isfinite(val):
-            return None
-        out[key] = max(lo, min(hi, val))
-    return out
+    get = controls.get
+    try:
+        steering = float(get('steering', 0))
+        acceleration = float(get('acceleration', 0))
+        braking = float(get('braking', 0))
+    except (TypeError, ValueError):
+        return None
+    if not (math.isfinite(steering) and math.isfinite(acceleration) and math.isfinite(braking)):
+        return None
+    return {
+        'steering': _clamp(steering, _STEERING_MIN, _STEERING_MAX),
+        'acceleration': _clamp(acceleration, _ACCELERATION_MIN, _ACCELERATION_MAX),
+        'braking': _clamp(braking, _BRAKING_MIN, _BRAKING_MAX),
+    }
 
 
 def canonicalize_name(raw, *, max_length=NAME_MAX_LENGTH, default=DEFAULT_NAME):
@@ -80,6 +80,7 @@ SEAT_STATE_DNF = 'dnf'
 
 HOST_LOSS_GRACE_SECONDS = 30.0
 ROOM_TTL_SECONDS = 300.0
+ROOM_IDLE_SECONDS = 1800.0
 STALE_CONTROLLER_SECONDS = 12.0
 
 
@@ -263,6 +264,25 @@ def _sync_legacy_views(room):
             }
 
 
+def _sync_legacy_stats(room, seat):
+    """Per-input counterpart of _sync_legacy_views.
+
+    Controls and motion arrive tens of times a second per player but never
+    change who is bound where, so only this seat's entry in the legacy
+    ``players`` view needs its stats refreshed instead of rebuilding the view
+    for every seat in the room.
+    """
+    payload = room['players'].get(seat.get('controller_sid'))
+    if payload is None:
+        _sync_legacy_views(room)
+        return
+    stats = seat['stats']
+    payload['position'] = stats['position']
+    payload['rotation'] = stats['rotation']
+    payload['velocity'] = stats['velocity']
+    payload['controls'] = dict(stats['controls'])
+
+
 def _touch_room(room, when=None):
     room['last_activity_at'] = now_seconds(when)
 
@@ -415,6 +435,8 @@ def _bind_controller(room, seat, sid, client_instance_id, can_render=False, when
     seat['state'] = SEAT_STATE_ACTIVE
     seat['last_seen_at'] = now
     seat['disconnected_at'] = None
+    # A new controller socket always gets its first control frame forwarded.
+    seat.pop('last_controls', None)
     seat['roles'] = participant_roles(room['topology'], can_render=can_render)
     seat['role'] = primary_role(room['topology'], can_render=can_render)
     room['sid_index'][sid] = {
@@ -605,7 +627,6 @@ def touch_controller(room, sid, lease_version=None, client_instance_id=None, now
     seat['last_seen_at'] = current_time
     seat['disconnected_at'] = None
     _touch_room(room, current_time)
-    _sync_legacy_views(room)
     return True
 
 
@@ -623,7 +644,7 @@ def update_seat_controls(room, sid, controls, lease_version=None, client_instanc
         'acceleration': controls.get('acceleration', 0),
         'braking': controls.get('braking', 0),
     }
-    _sync_legacy_views(room)
+    _sync_legacy_stats(room, seat)
     return seat
 
 
@@ -639,7 +660,7 @@ def update_seat_motion(room, sid, position, rotation, velocity, now=None):
     seat['stats']['position'] = position
     seat['stats']['rotation'] = rotation
     seat['stats']['velocity'] = velocity
-    _sync_legacy_views(room)
+    _sync_legacy_stats(room, seat)
     return seat
 
 
@@ -734,11 +755,8 @@ def kick_seat(room, target_player_id, now=None):
     is immediately re-joinable with no ghost left behind. Returns the removed seat +
     the kicked controller's sid (for the server to notify + despawn)."""
     current_time = now_seconds(now)
-    seat = None
-    for candidate in room['seats'].values():
-        if str(candidate.get('player_id')) == str(target_player_id):
-            seat = candidate
-            break
+    # player_id == seat_id, so the seats dict is already the id index.
+    seat = lookup_seat_by_id(room, target_player_id)
     if seat is None:
         return {'status': 'missing'}
 
@@ -765,7 +783,10 @@ def kick_seat(room, target_player_id, now=None):
     }
 
 
-def reap_room_if_needed(room, now=None, host_loss_grace=HOST_LOSS_GRACE_SECONDS, room_ttl=ROOM_TTL_SECONDS):
+def reap_room_if_needed(room, now=None, host_loss_grace=HOST_LOSS_GRACE_SECONDS, room_ttl=ROOM_TTL_SECONDS,
+                        room_idle=ROOM_IDLE_SECONDS, *, is_connected):
+    """``is_connected(sid)`` reports whether a host socket is still live; it
+    is only consulted once a room has crossed the idle threshold."""
     current_time = now_seconds(now)
     if room['phase'] == PHASE_HOST_LOST and room.get('host_lost_at') is not None:
         if current_time - room['host_lost_at'] >= float(host_loss_grace):
@@ -782,17 +803,39 @@ def reap_room_if_needed(room, now=None, host_loss_grace=HOST_LOSS_GRACE_SECONDS,
         append_room_trace(room, 'room_closed', current_time)
         return 'delete'
 
+    # Rooms abandoned without a host disconnect never start the TTL above;
+    # close them once nothing has touched them for room_idle seconds. A host
+    # whose socket is still connected (e.g. showing the lobby QR with nobody
+    # joined yet) keeps the room open however quiet it is.
+    if (
+        current_time - float(room.get('last_activity_at', current_time)) >= float(room_idle)
+        and not (room.get('host_sid') and is_connected(room['host_sid']))
+    ):
+        room['phase'] = PHASE_CLOSED
+        room['game_state'] = phase_to_game_state(PHASE_CLOSED)
+        append_room_trace(room, 'room_idle_closed', current_time)
+        return 'delete'
+
     return 'keep'
 
 
-def reap_rooms(game_rooms, now=None, host_loss_grace=HOST_LOSS_GRACE_SECONDS, room_ttl=ROOM_TTL_SECONDS):
+def reap_rooms(game_rooms, now=None, host_loss_grace=HOST_LOSS_GRACE_SECONDS, room_ttl=ROOM_TTL_SECONDS,
+               room_idle=ROOM_IDLE_SECONDS, *, is_connected):
+    """Advance/close every room in place; returns {room_code: room} for the
+    rooms deleted from ``game_rooms``.
+
+    ``is_connected(sid)`` reports whether a host socket is still live; rooms
+    with a live host are exempt from the idle rule."""
     current_time = now_seconds(now)
-    removed = []
+    removed = {}
     for room_code, room in list(game_rooms.items()):
-        result = reap_room_if_needed(room, current_time, host_loss_grace=host_loss_grace, room_ttl=room_ttl)
+        result = reap_room_if_needed(
+            room, current_time,
+            host_loss_grace=host_loss_grace, room_ttl=room_ttl, room_idle=room_idle,
+            is_connected=is_connected,
+        )
         if result == 'delete':
-            removed.append(room_code)
-            del game_rooms[room_code]
+            removed[room_code] = game_rooms.pop(room_code)
     return removed
 
 
@@ -807,6 +850,7 @@ __all__ = [
     'PHASE_RESULTS',
     'PHASE_ROUND_END',
     'PHASE_WAITING',
+    'ROOM_IDLE_SECONDS',
     'ROOM_TTL_SECONDS',
     'SEAT_STATE_ACTIVE',
     'SEAT_STATE_AWAY',
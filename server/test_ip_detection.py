@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import socket
+import struct
 import subprocess
 import platform
 import re
@@ -93,46 +94,30 @@ def platform_specific():
         
     return result
 
+# RFC 1918 private IP ranges as inclusive 32-bit bounds, with the ranking
+# score for each
+PRIVATE_RANGES = (
+    (0xC0A80000, 0xC0A8FFFF, 10),  # 192.168.0.0/16 (most common for home networks)
+    (0x0A000000, 0x0AFFFFFF, 5),   # 10.0.0.0/8 (common for larger networks)
+    (0xAC100000, 0xAC1FFFFF, 3),   # 172.16.0.0/12 (less common)
+)
+
+def ip_to_int(ip):
+    """Convert a dotted IPv4 address to its 32-bit integer value"""
+    return struct.unpack('!I', socket.inet_aton(ip))[0]
+
 def is_private_ip(ip):
     """Check if an IP is a private network address"""
-    # RFC 1918 private IP ranges
-    private_ranges = [
-        ('10.0.0.0', '10.255.255.255'),     # 10.0.0.0/8
-        ('172.16.0.0', '172.31.255.255'),   # 172.16.0.0/12
-        ('192.168.0.0', '192.168.255.255')  # 192.168.0.0/16
-    ]
-    
-    # Convert IP to integer for comparison
-    def ip_to_int(ip):
-        parts = ip.split('.')
-        return (int(parts[0]) << 24) + (int(parts[1]) << 16) + (int(parts[2]) << 8) + int(parts[3])
-    
     ip_int = ip_to_int(ip)
-    
-    for start, end in private_ranges:
-        if ip_to_int(start) <= ip_int <= ip_to_int(end):
-            return True
-    
-    return False
+    return any(start <= ip_int <= end for start, end, _ in PRIVATE_RANGES)
 
 def rank_ips(ips):
     """Rank IPs by likelihood of being the correct internal IP"""
     ranked = []
     
     for ip in ips:
-        score = 0
-        
-        # Prefer IPs in the 192.168.x.x range (most common for home networks)
-        if ip.startswith('192.168.'):
-            score += 10
-            
-        # Then prefer 10.x.x.x range (common for larger networks)
-        elif ip.startswith('10.'):
-            score += 5
-            
-        # Then prefer 172.16-31.x.x range (less common)
-        elif re.match(r'^172\.(1[6-9]|2[0-9]|3[0-1])\.', ip):
-            score += 3
+        ip_int = ip_to_int(ip)
+        score = next((points for start, end, points in PRIVATE_RANGES if start <= ip_int <= end), 0)
             
         # Avoid virtual and VPN IPs if possible
         if 'tun' in ip or 'vpn' in ip or 'virtual' in ip:
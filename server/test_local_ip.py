@@ -0,0 +1,80 @@
+"""LAN IP detection caching for the host page / QR endpoints.
+
+get_local_ip() is hit on every /host and /qrcode request; the detection behind
+it probes sockets and can shell out, so the result is cached with a short TTL
+and refreshed in the background once stale.
+"""
+
+import unittest
+from unittest import mock
+
+import server.app as server_app
+
+
+class LocalIpCacheTest(unittest.TestCase):
+    def setUp(self):
+        server_app._IP_CACHE.update({'ip': None, 'ts': 0.0, 'refreshing': False})
+
+    def tearDown(self):
+        server_app._IP_CACHE.update({'ip': None, 'ts': 0.0, 'refreshing': False})
+
+    def test_repeat_lookups_within_ttl_reuse_cached_ip(self):
+        with mock.patch.object(server_app, '_detect_local_ip', return_value='192.168.1.20') as detect:
+            self.assertEqual(server_app.get_local_ip(), '192.168.1.20')
+            self.assertEqual(server_app.get_local_ip(), '192.168.1.20')
+        self.assertEqual(detect.call_count, 1)
+
+    def test_stale_lookup_serves_cached_ip_and_refreshes_in_background(self):
+        now = [1000.0]
+        with mock.patch.object(server_app, '_detect_local_ip', side_effect=['192.168.1.20', '10.0.0.5']) as detect, \
+                mock.patch.object(server_app.time, 'monotonic', side_effect=lambda: now[0]), \
+                mock.patch.object(server_app.socketio, 'start_background_task') as start_task:
+            self.assertEqual(server_app.get_local_ip(), '192.168.1.20')
+            now[0] += server_app.LOCAL_IP_TTL_SECONDS + 1
+            self.assertEqual(server_app.get_local_ip(), '192.168.1.20')
+            self.assertEqual(server_app.get_local_ip(), '192.168.1.20')
+            start_task.assert_called_once_with(server_app._refresh_local_ip)
+
+            start_task.call_args[0][0]()
+            self.assertEqual(server_app.get_local_ip(), '10.0.0.5')
+        self.assertEqual(detect.call_count, 2)
+
+    def test_preferred_address_from_fast_path_skips_subprocess(self):
+        fake_sock = mock.MagicMock()
+        fake_sock.getsockname.return_value = ('10.8.0.2', 0)
+        addrinfo = [(None, None, None, '', ('192.168.11.14', 0))]
+        with mock.patch.object(server_app.socket, 'socket', return_value=fake_sock), \
+                mock.patch.object(server_app.socket, 'getaddrinfo', return_value=addrinfo), \
+                mock.patch.object(server_app.subprocess, 'check_output') as check_output:
+            self.assertEqual(server_app._detect_local_ip(), '192.168.11.14')
+        check_output.assert_not_called()
+
+    def test_interface_enumeration_uses_psutil_without_subprocess(self):
+        addrs = {
+            'lo': [mock.Mock(family=server_app.socket.AF_INET, address='127.0.0.1')],
+            'eth0': [
+                mock.Mock(family=server_app.socket.AF_INET6, address='fe80::1'),
+                mock.Mock(family=server_app.socket.AF_INET, address='192.168.4.7'),
+            ],
+        }
+        fake_psutil = mock.Mock()
+        fake_psutil.net_if_addrs.return_value = addrs
+        with mock.patch.object(server_app, 'psutil', fake_psutil), \
+                mock.patch.object(server_app.subprocess, 'check_output') as check_output:
+            self.assertEqual(server_app._platform_local_ips(), ['192.168.4.7'])
+        check_output.assert_not_called()
+
+    def test_ranking_prefers_192_168_then_10_then_172_private_ranges(self):
+        with mock.patch.object(server_app.socket, 'socket', side_effect=OSError), \
+                mock.patch.object(server_app.socket, 'getaddrinfo', return_value=[]), \
+                mock.patch.object(server_app, '_platform_local_ips',
+                                  return_value=['8.8.4.4', '172.32.0.1', '172.20.1.2', '10.1.2.3']):
+            self.assertEqual(server_app._detect_local_ip(), '10.1.2.3')
+        self.assertEqual(
+            [server_app._ip_rank(ip) for ip in ('192.168.0.9', '10.0.0.1', '172.31.255.255', '172.32.0.1', 'bogus')],
+            [0, 1, 2, 3, 3],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Join-QR rendering cache (/qrcode/<room_code>).
+
+A live room's join URL never changes, so its PNG is rendered once and served
+from memory (and browser-cacheable) until the room is reaped. Codes without a
+live room are rendered but never cached.
+"""
+
+import unittest
+from unittest import mock
+
+import server.app as server_app
+from server.app import app, game_rooms, socketio
+
+
+class QrCodeCacheTest(unittest.TestCase):
+    def setUp(self):
+        game_rooms.clear()
+        server_app._QR_CACHE.clear()
+        self.client = app.test_client()
+        self.host = socketio.test_client(app)
+        self.host.emit('create_room', {})
+        created = [e for e in self.host.get_received() if e['name'] == 'room_created']
+        self.room_code = created[0]['args'][0]['room_code']
+
+    def tearDown(self):
+        if self.host.is_connected():
+            self.host.disconnect()
+        game_rooms.clear()
+        server_app._QR_CACHE.clear()
+
+    def test_live_room_qr_is_rendered_once(self):
+        with mock.patch.object(server_app, '_render_qr_png', wraps=server_app._render_qr_png) as render:
+            first = self.client.get(f'/qrcode/{self.room_code}')
+            second = self.client.get(f'/qrcode/{self.room_code}')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.mimetype, 'image/png')
+        self.assertTrue(first.data.startswith(b'\x89PNG'))
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(first.headers['Cache-Control'], f'public, max-age={server_app.QR_MAX_AGE_SECONDS}')
+
+    def test_unknown_room_codes_are_not_cached(self):
+        resp = self.client.get('/qrcode/ZZZZ')
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotIn('ZZZZ', server_app._QR_CACHE)
+        self.assertEqual(resp.headers['Cache-Control'], 'no-cache')
+
+    def test_varying_host_ports_keep_one_cached_png_per_room(self):
+        for port in range(8100, 8120):
+            resp = self.client.get(f'/qrcode/{self.room_code}', headers={'Host': f'x:{port}'})
+            self.assertEqual(resp.status_code, 200)
+
+        join_url, png = server_app._QR_CACHE[self.room_code]
+        self.assertIn(':8119/', join_url)
+        self.assertEqual(png, resp.data)
+
+    def test_join_url_port_comes_from_forwarded_host_then_host(self):
+        cases = [
+            ({'X-Forwarded-Host': 'lan.example:9000', 'Host': 'localhost:5000'}, '9000'),
+            ({'Host': 'localhost:8123'}, '8123'),
+            ({'Host': '[::1]:8124'}, '8124'),
+            ({'Host': '[::1]'}, '80'),
+        ]
+        for headers, port in cases:
+            with app.test_request_context('/', headers=headers, environ_base={'SERVER_PORT': '80'}):
+                self.assertEqual(server_app._request_port(), port, headers)
+
+    def test_reaped_room_drops_its_cached_qr(self):
+        self.client.get(f'/qrcode/{self.room_code}')
+        self.assertIn(self.room_code, server_app._QR_CACHE)
+
+        def expire_room(rooms, **_):
+            return {self.room_code: rooms.pop(self.room_code)}
+
+        with mock.patch.object(server_app, 'reap_rooms', side_effect=expire_room):
+            server_app._reap_rooms_if_needed()
+
+        self.assertNotIn(self.room_code, server_app._QR_CACHE)
+
+
+if __name__ == '__main__':
+    unittest.main()
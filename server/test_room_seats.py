@@ -6,6 +6,7 @@ from server.room_seats import (
     PHASE_HOST_LOST,
     PHASE_RESULTS,
     PHASE_WAITING,
+    ROOM_IDLE_SECONDS,
     STALE_CONTROLLER_SECONDS,
     append_room_trace,
     begin_room_match,
@@ -14,9 +15,12 @@ from server.room_seats import (
     join_seat,
     new_room_state,
     reap_room_if_needed,
+    reap_rooms,
     reclaim_host,
     redacted_room_snapshot,
     return_room_to_lobby,
+    update_seat_controls,
+    update_seat_motion,
 )
 
 
@@ -150,7 +154,7 @@ class RoomSeatRegistryTest(unittest.TestCase):
         self.assertEqual(room['room_analytics_id'], room_analytics_id)
 
         disconnect_binding(room, 'host-2', now=200)
-        resolved = reap_room_if_needed(room, now=200 + HOST_LOSS_GRACE_SECONDS + 1)
+        resolved = reap_room_if_needed(room, now=200 + HOST_LOSS_GRACE_SECONDS + 1, is_connected=lambda sid: False)
         self.assertEqual(resolved, 'resolved')
         self.assertEqual(room['phase'], PHASE_RESULTS)
 
@@ -160,6 +164,52 @@ class RoomSeatRegistryTest(unittest.TestCase):
         self.assertEqual(room['host_epoch'], 3)
         self.assertEqual(room['room_analytics_id'], room_analytics_id)
 
+    def test_idle_room_is_reaped_without_host_loss(self):
+        room = new_room_state('ABCD', 'host-1', 'host-token', now=1000)
+        join_seat(room, 'controller-1', player_name='Alice', now=1010)
+        rooms = {'ABCD': room}
+
+        self.assertEqual(reap_rooms(rooms, now=1010 + ROOM_IDLE_SECONDS - 1, is_connected=lambda sid: False), {})
+        self.assertEqual(reap_rooms(rooms, now=1010 + ROOM_IDLE_SECONDS, is_connected=lambda sid: False), {'ABCD': room})
+        self.assertEqual(rooms, {})
+        self.assertEqual(room['trace'][-1]['reason'], 'room_idle_closed')
+
+    def test_idle_rule_spares_rooms_whose_host_is_still_connected(self):
+        room = new_room_state('ABCD', 'host-1', 'host-token', now=1000)
+        rooms = {'ABCD': room}
+
+        self.assertEqual(reap_rooms(rooms, now=1000 + ROOM_IDLE_SECONDS, is_connected=lambda sid: sid == 'host-1'), {})
+        self.assertEqual(reap_rooms(rooms, now=1000 + ROOM_IDLE_SECONDS, is_connected=lambda sid: False), {'ABCD': room})
+
+    def test_host_liveness_is_only_checked_for_idle_rooms(self):
+        room = new_room_state('ABCD', 'host-1', 'host-token', now=1000)
+        checked = []
+
+        def is_connected(sid):
+            checked.append(sid)
+            return True
+
+        reap_rooms({'ABCD': room}, now=1000 + ROOM_IDLE_SECONDS - 1, is_connected=is_connected)
+        self.assertEqual(checked, [])
+        reap_rooms({'ABCD': room}, now=1000 + ROOM_IDLE_SECONDS, is_connected=is_connected)
+        self.assertEqual(checked, ['host-1'])
+
+    def test_per_input_updates_refresh_only_the_sending_seat_in_legacy_view(self):
+        room = self.make_room()
+        join_seat(room, 'controller-1', player_name='Alice')
+        join_seat(room, 'controller-2', player_name='Bob')
+        begin_room_match(room)
+        bob_entry = room['players']['controller-2']
+
+        update_seat_motion(room, 'controller-1', [1, 2, 3], [0, 0.5, 0], [4, 0, 0])
+        update_seat_controls(room, 'controller-1', {'steering': -0.5, 'acceleration': 1, 'braking': 0})
+
+        alice = room['players']['controller-1']
+        self.assertEqual(alice['position'], [1, 2, 3])
+        self.assertEqual(alice['velocity'], [4, 0, 0])
+        self.assertEqual(alice['controls'], {'steering': -0.5, 'acceleration': 1, 'braking': 0})
+        self.assertIs(room['players']['controller-2'], bob_entry)
+
     def test_redacted_snapshot_masks_secrets_and_is_inspectable(self):
         room = self.make_room()
         joined = join_seat(room, 'controller-1', player_name='Alice', client_instance_id='tab-a')
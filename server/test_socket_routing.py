@@ -1,5 +1,8 @@
+import struct
 import unittest
+from unittest import mock
 
+import server.app as server_app
 from server.app import app, game_rooms, socketio, _read_build_identity
 from server.session_vocabulary import (
     TOPOLOGY_LOCAL, TOPOLOGY_REMOTE, TOPOLOGY_MIXED, DEFAULT_TOPOLOGY,
@@ -69,6 +72,14 @@ class SocketRoutingTest(unittest.TestCase):
         room = game_rooms[room_code]
         return room['host_token'], room['host_epoch']
 
+    def start_game(self, host, room_code):
+        token, epoch = self.get_host_auth(room_code)
+        host.emit('start_game', {
+            'room_code': room_code,
+            'host_token': token,
+            'host_epoch': epoch,
+        })
+
     def test_player_controls_forward_to_host_only_and_are_clamped(self):
         host = self.make_client()
         player = self.make_client()
@@ -132,6 +143,301 @@ class SocketRoutingTest(unittest.TestCase):
 
         self.assertEqual(self.event_named(host, 'player_controls_update'), [])
 
+    def test_room_code_collisions_are_redrawn(self):
+        taken = self.create_room(self.make_client())
+        with mock.patch.object(server_app, 'generate_room_code', side_effect=[taken, 'QZXW']):
+            self.assertEqual(self.create_room(self.make_client()), 'QZXW')
+        code = server_app.generate_room_code()
+        self.assertEqual(len(code), 4)
+        self.assertTrue(code.isalpha() and code.isupper())
+
+    def test_host_takeover_moves_host_events_to_the_new_socket(self):
+        old_host = self.make_client()
+        player = self.make_client()
+
+        create_event = self.create_room_event(old_host)
+        room_code = create_event['room_code']
+        self.join_player(player, room_code, 'Takeover')
+
+        new_host = self.make_client()
+        new_host.emit('reclaim_room', {'room_code': room_code, 'host_token': create_event['host_token']})
+        self.assertEqual(len(self.event_named(new_host, 'room_reclaimed')), 1)
+        old_host.get_received()
+
+        player.emit('player_control_update', {
+            'room_code': room_code,
+            'controls': {'steering': 0.25, 'acceleration': 1, 'braking': 0},
+            'timestamp': 1,
+        })
+
+        self.assertEqual(len(self.event_named(new_host, 'player_controls_update')), 1)
+        self.assertEqual(self.event_named(old_host, 'player_controls_update'), [])
+
+    def test_reaped_room_host_gets_nothing_from_a_reused_code(self):
+        old_host = self.make_client()
+        room_code = self.create_room(old_host)
+        game_rooms[room_code]['reap_at'] = 0
+        server_app._reap_rooms_if_needed()
+        self.assertNotIn(room_code, game_rooms)
+
+        new_host = self.make_client()
+        player = self.make_client()
+        with mock.patch.object(server_app, 'generate_room_code', return_value=room_code):
+            self.assertEqual(self.create_room(new_host), room_code)
+        self.join_player(player, room_code, 'Reused')
+        old_host.get_received()
+
+        player.emit('player_control_update', {
+            'room_code': room_code,
+            'controls': {'steering': 0.3, 'acceleration': 1, 'braking': 0},
+            'timestamp': 1,
+        })
+
+        self.assertEqual(len(self.event_named(new_host, 'player_controls_update')), 1)
+        self.assertEqual(self.event_named(old_host, 'player_controls_update'), [])
+
+    def test_room_reaper_loop_survives_a_failing_pass(self):
+        class Stop(Exception):
+            pass
+
+        with mock.patch.object(socketio, 'sleep', side_effect=[None, None, Stop]), \
+                mock.patch.object(server_app, '_reap_rooms_if_needed', side_effect=[RuntimeError('boom'), None]) as reap, \
+                mock.patch.object(server_app.logger, 'exception') as log_exception:
+            with self.assertRaises(Stop):
+                server_app._room_reaper_loop()
+
+        self.assertEqual(reap.call_count, 2)
+        log_exception.assert_called_once()
+
+    def test_motion_flush_loop_survives_a_failing_tick(self):
+        class Stop(Exception):
+            pass
+
+        with mock.patch.object(socketio, 'sleep', side_effect=[None, None, Stop]), \
+                mock.patch.object(server_app, '_flush_pending_motion', side_effect=[RuntimeError('boom'), None]) as flush, \
+                mock.patch.object(server_app.logger, 'exception') as log_exception:
+            with self.assertRaises(Stop):
+                server_app._motion_flush_loop()
+
+        self.assertEqual(flush.call_count, 2)
+        log_exception.assert_called_once()
+
+    def test_unchanged_controls_are_not_reforwarded(self):
+        host = self.make_client()
+        player = self.make_client()
+
+        room_code = self.create_room(host)
+        self.join_player(player, room_code, 'Holder')
+        host.get_received()
+
+        def send(steering, acceleration, braking=0):
+            player.emit('player_control_update', {
+                'room_code': room_code,
+                'controls': {'steering': steering, 'acceleration': acceleration, 'braking': braking},
+                'timestamp': 123456,
+            })
+
+        send(0.5, 1)
+        send(0.5, 1)
+        send(0.505, 1)
+        send(0.52, 1)
+        send(0.52, 0)
+
+        forwarded = [
+            (u['args'][0]['steering'], u['args'][0]['acceleration'])
+            for u in self.event_named(host, 'player_controls_update')
+        ]
+        self.assertEqual(forwarded, [(0.5, 1.0), (0.52, 1.0), (0.52, 0.0)])
+
+    def test_reconnected_controller_first_frame_reaches_host(self):
+        host = self.make_client()
+        player = self.make_client()
+
+        room_code = self.create_room(host)
+        join = self.join_player_event(player, room_code, 'Returner', client_instance_id='tab-a')
+        controls = {
+            'room_code': room_code,
+            'controls': {'steering': 0.5, 'acceleration': 1, 'braking': 0},
+            'timestamp': 1,
+        }
+        player.emit('player_control_update', controls)
+        player.disconnect()
+        host.get_received()
+
+        returning = self.make_client()
+        self.join_player(
+            returning,
+            room_code,
+            'Returner',
+            seat_token=join['seat_token'],
+            client_instance_id='tab-a',
+        )
+        returning.emit('player_control_update', controls)
+
+        forwarded = self.event_named(host, 'player_controls_update')
+        self.assertEqual(len(forwarded), 1)
+        self.assertEqual(forwarded[0]['args'][0]['player_id'], join['player_id'])
+
+    def test_player_motion_reaches_host_as_packed_frame_on_flush(self):
+        host = self.make_client()
+        player = self.make_client()
+
+        room_code = self.create_room(host)
+        player_join = self.join_player_event(player, room_code, 'MotionOne')
+        self.start_game(host, room_code)
+        host.get_received()
+        player.get_received()
+
+        with mock.patch.object(socketio, 'start_background_task'):
+            player.emit('player_update', {
+                'room_code': room_code,
+                'position': [1.5, 0.5, -2.0],
+                'rotation': [0, 0.25, 0],
+                'velocity': [3.0, 0, -1.0],
+            })
+            player.emit('player_update', {
+                'room_code': room_code,
+                'position': [1.5, 0.5],
+                'rotation': [0, 0.25, 0],
+                'velocity': [3.0, 0, -1.0],
+            })
+            self.assertEqual(self.event_named(host, 'players_update'), [])
+            server_app._flush_pending_motion()
+
+        updates = self.event_named(host, 'players_update')
+        self.assertEqual(len(updates), 1)
+        frame = updates[0]['args'][0]
+        self.assertEqual(len(frame), 26)
+        self.assertEqual(struct.unpack('<II9h', frame), (
+            player_join['player_id'], player_join['seat_id'],
+            75, 25, -100,
+            0, round(0.25 * server_app.MOTION_ROTATION_SCALE), 0,
+            300, 0, -100,
+        ))
+        self.assertEqual(self.event_named(player, 'players_update'), [])
+
+    def test_mis_sized_motion_vectors_are_dropped_even_when_they_total_nine(self):
+        host = self.make_client()
+        player = self.make_client()
+
+        room_code = self.create_room(host)
+        self.join_player(player, room_code, 'Lopsided')
+        self.start_game(host, room_code)
+        host.get_received()
+        seat = next(iter(game_rooms[room_code]['seats'].values()))
+        before = dict(seat['stats'])
+
+        with mock.patch.object(socketio, 'start_background_task'):
+            player.emit('player_update', {
+                'room_code': room_code,
+                'position': [0, 0, 0, 0],
+                'rotation': [0, 0],
+                'velocity': [0, 0, 0],
+            })
+            server_app._flush_pending_motion()
+
+        self.assertEqual(self.event_named(host, 'players_update'), [])
+        self.assertEqual(seat['stats'], before)
+
+    def test_motion_is_batched_per_host_with_newest_frame_per_player(self):
+        host = self.make_client()
+        players = [self.make_client(), self.make_client()]
+
+        room_code = self.create_room(host)
+        joins = [self.join_player_event(p, room_code, f'Batch{i}') for i, p in enumerate(players)]
+        self.start_game(host, room_code)
+        host.get_received()
+
+        with mock.patch.object(socketio, 'start_background_task'):
+            for x in (1.0, 2.0, 3.0):
+                for offset, player in enumerate(players):
+                    player.emit('player_update', {
+                        'room_code': room_code,
+                        'position': [x + 10 * offset, 0, 0],
+                        'rotation': [0, 0, 0],
+                        'velocity': [0, 0, 0],
+                    })
+            server_app._flush_pending_motion()
+            server_app._flush_pending_motion()
+
+        updates = self.event_named(host, 'players_update')
+        self.assertEqual(len(updates), 1)
+        payload = updates[0]['args'][0]
+        self.assertEqual(len(payload), 52)
+        frames = {
+            fields[0]: fields[2] / server_app.MOTION_POSITION_SCALE
+            for fields in struct.iter_unpack('<II9h', payload)
+        }
+        self.assertEqual(frames, {joins[0]['player_id']: 3.0, joins[1]['player_id']: 13.0})
+        self.assertEqual(server_app._pending_motion, {})
+
+    def test_parked_car_motion_is_skipped_until_heartbeat(self):
+        host = self.make_client()
+        player = self.make_client()
+
+        room_code = self.create_room(host)
+        self.join_player(player, room_code, 'Parked')
+        self.start_game(host, room_code)
+        host.get_received()
+
+        now = [100.0]
+
+        def send(x, vx=0):
+            player.emit('player_update', {
+                'room_code': room_code,
+                'position': [x, 0, 0],
+                'rotation': [0, 0.005, 0],
+                'velocity': [vx, 0, 0],
+            })
+            server_app._flush_pending_motion()
+            return len(self.event_named(host, 'players_update'))
+
+        with mock.patch.object(socketio, 'start_background_task'), \
+                mock.patch.object(server_app.time, 'monotonic', side_effect=lambda: now[0]):
+            self.assertEqual(send(1.0), 1)
+            now[0] += 0.1
+            self.assertEqual(send(1.004), 0)
+            self.assertEqual(send(1.004, vx=2), 1)
+            now[0] += 0.1
+            self.assertEqual(send(1.05), 1)
+            now[0] += 0.1
+            self.assertEqual(send(1.05), 0)
+            now[0] += server_app.MOTION_HEARTBEAT_SECONDS
+            self.assertEqual(send(1.05), 1)
+
+        seat = next(iter(game_rooms[room_code]['seats'].values()))
+        self.assertEqual(seat['stats']['position'], [1.05, 0, 0])
+
+    def test_mis_sized_update_inside_heartbeat_window_is_dropped_cleanly(self):
+        host = self.make_client()
+        player = self.make_client()
+
+        room_code = self.create_room(host)
+        self.join_player(player, room_code, 'Wobbly')
+        self.start_game(host, room_code)
+        host.get_received()
+
+        def send(position, rotation, velocity):
+            player.emit('player_update', {
+                'room_code': room_code,
+                'position': position,
+                'rotation': rotation,
+                'velocity': velocity,
+            })
+            server_app._flush_pending_motion()
+            return len(self.event_named(host, 'players_update'))
+
+        with mock.patch.object(socketio, 'start_background_task'):
+            self.assertEqual(send([0, 0, 0, 0], [0, 0], [0, 0, 0]), 0)
+            self.assertEqual(send([0, 0, 0, 0], [0, 0], [0, 0, 0]), 0)
+            self.assertEqual(send([1, 0, 0], [0, 0, 0], [0, 0, 0]), 1)
+            self.assertEqual(send([1, 0, 0], [0, 0], [0, 0, 0, 0]), 0)
+            self.assertEqual(send([1, 0, 0], [0, 0, 0], [0, 0]), 0)
+
+        seat = next(iter(game_rooms[room_code]['seats'].values()))
+        self.assertEqual(seat['stats']['position'], [1, 0, 0])
+        self.assertEqual(seat['last_motion'][2:], ([1, 0, 0], [0, 0, 0]))
+
     def test_duplicate_controller_takeover_rejects_stale_input_and_preserves_player_id(self):
         host = self.make_client()
         player_a = self.make_client()
@@ -310,6 +616,58 @@ class SocketRoutingTest(unittest.TestCase):
         self.assertTrue(any(event['args'][0]['room_analytics_id'] == room_analytics_id for event in room_phase_events))
         self.assertTrue(any(event['args'][0]['match_id'] == game_rooms[room_code]['match_id'] for event in room_phase_events))
 
+    def test_player_disconnect_only_touches_the_rooms_it_joined(self):
+        host = self.make_client()
+        other_host = self.make_client()
+        player = self.make_client()
+
+        room_code = self.create_room(host)
+        other_room = self.create_room(other_host)
+        player_join = self.join_player_event(player, room_code, 'LeftEarly')
+        player_sid = game_rooms[room_code]['seats'][player_join['seat_id']]['controller_sid']
+        self.assertEqual(server_app._sid_rooms[player_sid], {room_code})
+        host.get_received()
+        other_host.get_received()
+
+        player.disconnect()
+
+        left = self.event_named(host, 'player_left')
+        self.assertEqual(len(left), 1)
+        self.assertEqual(left[0]['args'][0]['player_id'], player_join['player_id'])
+        self.assertEqual(self.event_named(other_host, 'player_left'), [])
+        self.assertNotIn(player_sid, server_app._sid_rooms)
+        self.assertEqual(game_rooms[other_room]['phase'], 'waiting')
+
+    def test_idle_room_with_connected_host_is_kept(self):
+        host = self.make_client()
+        room_code = self.create_room(host)
+        host.get_received()
+        game_rooms[room_code]['last_activity_at'] -= server_app.ROOM_IDLE_SECONDS + 1
+
+        server_app._reap_rooms_if_needed()
+
+        self.assertIn(room_code, game_rooms)
+        self.assertEqual(self.event_named(host, 'host_disconnected'), [])
+
+    def test_idle_room_reap_notifies_parked_clients(self):
+        host = self.make_client()
+        player = self.make_client()
+
+        room_code = self.create_room(host)
+        self.join_player(player, room_code, 'Parked')
+        player.get_received()
+        # The host vanished without a disconnect ever reaching the server.
+        game_rooms[room_code]['host_sid'] = 'vanished-host-sid'
+        game_rooms[room_code]['last_activity_at'] -= server_app.ROOM_IDLE_SECONDS + 1
+
+        server_app._reap_rooms_if_needed()
+
+        self.assertNotIn(room_code, game_rooms)
+        closed = self.event_named(player, 'host_disconnected')
+        self.assertEqual(len(closed), 1)
+        self.assertEqual(closed[0]['args'][0]['room_code'], room_code)
+        self.assertEqual(closed[0]['args'][0]['phase'], 'closed')
+
     def test_release_and_analytics_ids_propagate_through_join_start_and_return_to_lobby(self):
         host = self.make_client()
         player = self.make_client()